@@ -11,6 +11,12 @@
 #   function <func-name> [args...]
 #     Run a single function with optional arguments.
 #
+#   serve
+#     Warm spare: source the libraries, then wait for one NUL-delimited
+#     "<func-name> [args...]" request on stdin and run it like "function"
+#     (config, scheduler and pool init happen after the request arrives).
+#     Lets the executor pay the library sourcing cost ahead of time.
+#
 # Security: Only svc_* prefixed functions are allowed.
 # =============================================================================
 set -euo pipefail
@@ -96,6 +102,20 @@ activity_init "$PROJECT_DIR"
 # the state file that Python manages.
 # =============================================================================
 
+# A serve-mode spare has only paid for library sourcing so far. Wait for its
+# request here and continue as "function", so the config, scheduler and pool
+# state below are read when the call is made rather than when the spare was
+# started (possibly a whole service interval earlier).
+if [[ "${1:-}" == "serve" ]]; then
+    request=()
+    while IFS= read -r -d '' _arg; do
+        request+=("$_arg")
+    done
+    # Executor shut down without handing over a request
+    [ "${#request[@]}" -gt 0 ] || exit 0
+    set -- function "${request[@]}"
+fi
+
 # Default handler variables (set before scheduler_init which may read them)
 AGING_FACTOR="${AGING_FACTOR:-7}"
 SIBLING_WIP_PENALTY="${SIBLING_WIP_PENALTY:-20000}"
@@ -175,7 +195,7 @@ _validate_func() {
 }
 
 # Main dispatch
-mode="${1:?Usage: bash-bridge.sh <phase|function> ...}"
+mode="${1:?Usage: bash-bridge.sh <phase|function|pipeline|serve> ...}"
 shift
 
 case "$mode" in
@@ -248,7 +268,7 @@ case "$mode" in
         exit "$_exit_code"
         ;;
     *)
-        echo "ERROR: Unknown mode: $mode (expected: phase|function|pipeline)" >&2
+        echo "ERROR: Unknown mode: $mode (expected: phase|function|pipeline|serve)" >&2
         exit 1
         ;;
 esac
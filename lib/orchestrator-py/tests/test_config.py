@@ -10,14 +10,15 @@ from wiggum_orchestrator.config import (
     ServiceRegistry,
     _normalize_triggers,
     apply_run_mode_filters,
+    build_services,
     load_services,
 )
 
 
 @pytest.fixture()
-def services_json(tmp_path):
-    """Create a minimal services.json for testing."""
-    config = {
+def services_config():
+    """Minimal parsed services.json for in-memory tests."""
+    return {
         "version": "2.0",
         "defaults": {
             "timeout": 300,
@@ -78,10 +79,15 @@ def services_json(tmp_path):
             },
         ],
     }
+
+
+@pytest.fixture()
+def services_json(tmp_path, services_config):
+    """Write services_config to a services.json under tmp_path."""
     config_dir = tmp_path / "config"
     config_dir.mkdir()
     config_file = config_dir / "services.json"
-    config_file.write_text(json.dumps(config))
+    config_file.write_text(json.dumps(services_config))
     return tmp_path
 
 
@@ -115,12 +121,25 @@ def test_service_config_properties():
     assert svc.cb_cooldown == 300
 
 
-def test_service_registry_phases(services_json):
-    wiggum_home = str(services_json)
-    ralph_dir = str(services_json / "ralph")
-    os.makedirs(ralph_dir, exist_ok=True)
+def test_service_config_uses_slots():
+    """ServiceConfig should be slotted (no per-instance __dict__)."""
+    svc = ServiceConfig(id="test")
+    assert not hasattr(svc, "__dict__")
+    assert svc.schedule_type == "tick"
+    assert svc.interval == 0
+    assert svc.jitter == 0
 
-    services = load_services(wiggum_home, ralph_dir)
+
+def test_service_config_skip_if_running():
+    assert ServiceConfig(id="a").skip_if_running is True
+    queued = ServiceConfig(id="b", concurrency={"if_running": "queue"})
+    assert queued.skip_if_running is False
+    multi = ServiceConfig(id="c", concurrency={"max_instances": 2})
+    assert multi.skip_if_running is False
+
+
+def test_service_registry_phases(services_config):
+    services = build_services(services_config)
     registry = ServiceRegistry(services)
 
     startup = registry.get_phase_services("startup")
@@ -140,13 +159,9 @@ def test_service_registry_phases(services_json):
     assert len(shutdown) == 1
 
 
-def test_registry_sorted_by_order(services_json):
+def test_registry_sorted_by_order(services_config):
     """Services within a phase should be sorted by order."""
-    wiggum_home = str(services_json)
-    ralph_dir = str(services_json / "ralph")
-    os.makedirs(ralph_dir, exist_ok=True)
-
-    services = load_services(wiggum_home, ralph_dir)
+    services = build_services(services_config)
     registry = ServiceRegistry(services)
 
     periodic = registry.get_phase_services("periodic")
@@ -154,6 +169,105 @@ def test_registry_sorted_by_order(services_json):
     assert orders == sorted(orders)
 
 
+def test_registry_phase_buckets_exclude_disabled_and_reverse_shutdown():
+    """Phase buckets hold only enabled services; shutdown is reversed."""
+    services = [
+        ServiceConfig(id="a", phase="shutdown", order=10),
+        ServiceConfig(id="b", phase="shutdown", order=20),
+        ServiceConfig(id="c", phase="shutdown", order=30, enabled=False),
+        ServiceConfig(id="d", phase="pre", order=20),
+        ServiceConfig(id="e", phase="pre", order=10),
+    ]
+    registry = ServiceRegistry(services)
+
+    assert [s.id for s in registry.get_phase_services("shutdown")] == ["b", "a"]
+    assert [s.id for s in registry.get_phase_services("pre")] == ["e", "d"]
+    assert registry.get_phase_services("post") == ()
+
+
+def test_registry_shutdown_ties_run_in_reverse_config_order():
+    """Shutdown reverses the whole run, ties included, like bash's tac."""
+    services = [
+        ServiceConfig(id="a", phase="shutdown", order=10),
+        ServiceConfig(id="b", phase="shutdown", order=10),
+        ServiceConfig(id="c", phase="shutdown", order=20),
+    ]
+    registry = ServiceRegistry(services)
+    assert [s.id for s in registry.get_phase_services("shutdown")] == ["c", "b", "a"]
+
+
+def test_registry_phase_functions():
+    services = [
+        ServiceConfig(id="b", phase="pre", order=20,
+                      execution={"type": "function", "function": "svc_b"}),
+        ServiceConfig(id="a", phase="pre", order=10,
+                      execution={"type": "function", "function": "svc_a"}),
+        ServiceConfig(id="cmd", phase="pre",
+                      execution={"type": "command", "command": "true"}),
+        ServiceConfig(id="off", phase="pre", enabled=False,
+                      execution={"type": "function", "function": "svc_off"}),
+    ]
+    registry = ServiceRegistry(services)
+
+    svcs, functions, conditional = registry.get_phase_functions("pre")
+    assert [s.id for s in svcs] == ["a", "b"]
+    assert functions == ("svc_a", "svc_b")
+    assert conditional is False
+    assert registry.get_phase_functions("post") == ((), (), False)
+
+
+def test_registry_services_for_event():
+    """Event index should resolve exact and glob-suffix triggers in order."""
+    services = [
+        ServiceConfig(
+            id="on-any",
+            order=30,
+            schedule={"type": "event", "trigger": "service.completed:*"},
+        ),
+        ServiceConfig(
+            id="on-extract",
+            order=10,
+            schedule={"type": "event", "trigger": [
+                "service.completed:extract", "service.*",
+            ]},
+        ),
+        ServiceConfig(
+            id="disabled",
+            order=20,
+            enabled=False,
+            schedule={"type": "event", "trigger": ["service.completed:extract"]},
+        ),
+        ServiceConfig(id="interval", schedule={"type": "interval", "interval": 60}),
+    ]
+    registry = ServiceRegistry(services)
+
+    ids = [s.id for s in registry.services_for_event("service.completed:extract")]
+    assert ids == ["on-extract", "on-any"]
+
+    ids = [s.id for s in registry.services_for_event("service.failed:extract")]
+    assert ids == ["on-extract"]
+
+    assert registry.services_for_event("task.spawned") == ()
+
+    # Memoized per event name
+    first = registry.services_for_event("service.completed:extract")
+    assert registry.services_for_event("service.completed:extract") is first
+
+    # Completion events of registered services are resolved up front
+    assert "service.succeeded:interval" in registry._event_cache
+
+
+def test_registry_completion_events():
+    """Completion event names should be prebuilt per service."""
+    registry = ServiceRegistry([ServiceConfig(id="extract")])
+    assert registry.completion_events("extract") == (
+        "service.completed:extract",
+        "service.succeeded:extract",
+        "service.failed:extract",
+    )
+    assert registry.completion_events("unknown")[2] == "service.failed:unknown"
+
+
 def test_apply_run_mode_merge_only():
     """merge-only mode should disable fix-workers and multi-pr-planner."""
     services = [
@@ -209,6 +323,25 @@ def test_apply_no_flags():
         assert s.enabled is False, f"{s.id} should be disabled"
 
 
+def test_run_mode_filters_use_configured_groups(services_config):
+    """Services joining a built-in group via "groups" follow its flags."""
+    services_config["services"].append({
+        "id": "custom-sync",
+        "groups": ["sync"],
+        "execution": {"type": "command", "command": "true"},
+    })
+    services = build_services(services_config, run_mode="default",
+                              no_flags={"no_sync": True})
+    ids = {s.id for s in services}
+    assert "custom-sync" not in ids
+    assert "github-issue-sync" not in ids
+
+    registry = ServiceRegistry(build_services(services_config))
+    assert {s.id for s in registry.get_group("sync")} >= {
+        "custom-sync", "github-issue-sync",
+    }
+
+
 def test_override_services(services_json):
     """Project overrides should modify service config."""
     ralph_dir = services_json / "ralph"
@@ -226,6 +359,31 @@ def test_override_services(services_json):
     assert by_id["github-issue-sync"].enabled is False
 
 
+def test_override_schedule_merges(services_config):
+    """Schedule overrides should merge into the base schedule."""
+    override = {
+        "services": [
+            {"id": "github-issue-sync", "schedule": {"interval": 600}},
+        ]
+    }
+
+    services = build_services(services_config, override)
+    by_id = {s.id: s for s in services}
+    assert by_id["github-issue-sync"].interval == 600
+    assert by_id["github-issue-sync"].jitter == 15
+
+
+def test_build_services_run_mode_drops_disabled(services_config):
+    """With a run mode, disabled services should not be instantiated."""
+    override = {"services": [{"id": "task-spawner", "enabled": False}]}
+
+    services = build_services(
+        services_config, override, "merge-only", {"no_sync": True},
+    )
+    ids = {s.id for s in services}
+    assert ids == {"validate-kanban", "worker-cleanup", "state-save"}
+
+
 def test_normalize_triggers():
     """on_complete/on_failure/on_finish should become schedule.trigger patterns."""
     services = [
@@ -303,3 +461,34 @@ def test_normalize_triggers_combined():
     assert "service.succeeded:svc-a" in svc.schedule["trigger"]
     assert "service.failed:svc-b" in svc.schedule["trigger"]
     assert "service.completed:svc-c" in svc.schedule["trigger"]
+
+
+def test_load_services_cached_copy_is_isolated(services_json):
+    """Repeat loads should return fresh objects not shared with the cache."""
+    wiggum_home = str(services_json)
+    ralph_dir = str(services_json / "ralph")
+    os.makedirs(ralph_dir, exist_ok=True)
+
+    first = load_services(wiggum_home, ralph_dir)
+    first[2].schedule["interval"] = 9999
+    first[2].enabled = False
+
+    second = load_services(wiggum_home, ralph_dir)
+    assert second[2].schedule["interval"] == 120
+    assert second[2].enabled is True
+
+
+def test_load_services_cache_invalidated_on_change(services_json):
+    """Editing services.json should be picked up on the next load."""
+    wiggum_home = str(services_json)
+    ralph_dir = str(services_json / "ralph")
+    os.makedirs(ralph_dir, exist_ok=True)
+
+    assert len(load_services(wiggum_home, ralph_dir)) == 6
+
+    config_file = services_json / "config" / "services.json"
+    config = json.loads(config_file.read_text())
+    config["services"] = config["services"][:2]
+    config_file.write_text(json.dumps(config))
+
+    assert len(load_services(wiggum_home, ralph_dir)) == 2
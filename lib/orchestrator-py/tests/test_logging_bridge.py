@@ -1,6 +1,7 @@
 """Tests for logging_bridge.py — log format and level filtering."""
 
 import os
+import re
 
 from wiggum_orchestrator import logging_bridge
 
@@ -11,6 +12,14 @@ def test_format():
     assert line.startswith("[")
 
 
+def test_format_timestamp_matches_bash():
+    line = logging_bridge._format("WARN", "first")
+    assert re.match(r"^\[\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}\] WARN: first$", line)
+    # Cached prefix is reused within the same second
+    second = logging_bridge._format("INFO", "second")
+    assert second.endswith("] INFO: second")
+
+
 def test_level_filtering():
     logging_bridge.init(log_level="WARN")
     # After setting WARN, INFO and DEBUG should be suppressed
@@ -47,3 +56,33 @@ def test_debug_env_override():
             os.environ.pop("DEBUG", None)
         # Reset
         logging_bridge.init(log_level="INFO")
+
+
+def test_suppressed_levels_not_written(tmp_path):
+    log_file = str(tmp_path / "test.log")
+    logging_bridge.init(log_level="WARN", log_file=log_file)
+    try:
+        logging_bridge.log_debug("debug message")
+        logging_bridge.log("info message")
+        logging_bridge.log_warn("warn message")
+
+        with open(log_file) as f:
+            content = f.read()
+        assert "debug message" not in content
+        assert "info message" not in content
+        assert "] WARN: warn message" in content
+    finally:
+        logging_bridge.init(log_level="INFO")
+
+
+def test_reinit_closes_previous_handle(tmp_path):
+    logging_bridge.init(log_level="INFO", log_file=str(tmp_path / "a.log"))
+    first = logging_bridge._log_fp
+    assert first is not None
+
+    logging_bridge.init(log_level="INFO", log_file=str(tmp_path / "b.log"))
+    assert first.closed
+    logging_bridge.log("second file message")
+
+    assert "second file message" in (tmp_path / "b.log").read_text()
+    assert (tmp_path / "a.log").read_text() == ""
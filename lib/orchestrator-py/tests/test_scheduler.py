@@ -1,13 +1,12 @@
 """Tests for service_scheduler.py — phase dispatch and interval scheduling."""
 
 import time
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
 import pytest
 
 from wiggum_orchestrator.circuit_breaker import CircuitBreaker
 from wiggum_orchestrator.config import ServiceConfig, ServiceRegistry
-from wiggum_orchestrator.service_executor import ServiceExecutor
 from wiggum_orchestrator.service_scheduler import ServiceScheduler
 from wiggum_orchestrator.service_state import ServiceState
 
@@ -22,21 +21,57 @@ def cb(state):
     return CircuitBreaker(state)
 
 
+class RecordingExecutor:
+    """ServiceExecutor stand-in that records calls in plain lists."""
+
+    def __init__(self):
+        self.phase_calls = []
+        self.function_calls = []
+        self.command_calls = []
+        self.pipeline_calls = []
+        self.phase_result = True
+        self.function_rc = 0
+        self.function_rcs = None  # optional per-call exit codes, consumed in order
+
+    def run_phase(self, phase, functions):
+        self.phase_calls.append((phase, list(functions)))
+        return self.phase_result
+
+    def run_function(self, svc, extra_args=None):
+        self.function_calls.append(svc.id)
+        if self.function_rcs:
+            return self.function_rcs.pop(0)
+        return self.function_rc
+
+    def run_command(self, svc):
+        self.command_calls.append(svc.id)
+        return 0
+
+    def run_pipeline(self, svc):
+        self.pipeline_calls.append(svc.id)
+        return 0
+
+    def run_function_background(self, svc, extra_args=None):
+        return None
+
+    def run_command_background(self, svc):
+        return None
+
+    def interrupt(self):
+        pass
+
+
 @pytest.fixture()
-def mock_executor():
-    executor = MagicMock(spec=ServiceExecutor)
-    executor.run_phase.return_value = True
-    executor.run_function.return_value = 0
-    executor.run_command.return_value = 0
-    return executor
+def executor():
+    return RecordingExecutor()
 
 
-def _make_scheduler(services, state, mock_executor, cb):
+def _make_scheduler(services, state, executor, cb):
     registry = ServiceRegistry(services)
-    return ServiceScheduler(registry, state, mock_executor, cb)
+    return ServiceScheduler(registry, state, executor, cb)
 
 
-def test_startup_phase_calls_bridge(state, mock_executor, cb):
+def test_startup_phase_calls_bridge(state, executor, cb):
     """Startup phase should collect functions and call bridge once."""
     services = [
         ServiceConfig(
@@ -53,19 +88,18 @@ def test_startup_phase_calls_bridge(state, mock_executor, cb):
             execution={"type": "function", "function": "svc_orch_init_scheduler"},
         ),
     ]
-    scheduler = _make_scheduler(services, state, mock_executor, cb)
+    scheduler = _make_scheduler(services, state, executor, cb)
     result = scheduler.run_phase("startup")
 
     assert result is True
-    mock_executor.run_phase.assert_called_once_with(
-        "startup",
-        ["svc_orch_validate_kanban", "svc_orch_init_scheduler"],
-    )
+    assert executor.phase_calls == [
+        ("startup", ["svc_orch_validate_kanban", "svc_orch_init_scheduler"]),
+    ]
 
 
-def test_startup_failure_returns_false(state, mock_executor, cb):
+def test_startup_failure_returns_false(state, executor, cb):
     """Startup failure with required service should return False."""
-    mock_executor.run_phase.return_value = False
+    executor.phase_result = False
     services = [
         ServiceConfig(
             id="critical",
@@ -75,12 +109,12 @@ def test_startup_failure_returns_false(state, mock_executor, cb):
             execution={"type": "function", "function": "svc_critical"},
         ),
     ]
-    scheduler = _make_scheduler(services, state, mock_executor, cb)
+    scheduler = _make_scheduler(services, state, executor, cb)
     result = scheduler.run_phase("startup")
     assert result is False
 
 
-def test_shutdown_reverse_order(state, mock_executor, cb):
+def test_shutdown_reverse_order(state, executor, cb):
     """Shutdown phase should reverse service order."""
     services = [
         ServiceConfig(
@@ -96,16 +130,15 @@ def test_shutdown_reverse_order(state, mock_executor, cb):
             execution={"type": "function", "function": "svc_second"},
         ),
     ]
-    scheduler = _make_scheduler(services, state, mock_executor, cb)
+    scheduler = _make_scheduler(services, state, executor, cb)
     scheduler.run_phase("shutdown")
 
-    mock_executor.run_phase.assert_called_once_with(
-        "shutdown",
-        ["svc_second", "svc_first"],  # reversed
-    )
+    assert executor.phase_calls == [
+        ("shutdown", ["svc_second", "svc_first"]),  # reversed
+    ]
 
 
-def test_periodic_interval_due(state, mock_executor, cb):
+def test_periodic_interval_due(state, executor, cb):
     """Periodic service should run when interval has elapsed."""
     services = [
         ServiceConfig(
@@ -116,7 +149,7 @@ def test_periodic_interval_due(state, mock_executor, cb):
             execution={"type": "function", "function": "svc_sync"},
         ),
     ]
-    scheduler = _make_scheduler(services, state, mock_executor, cb)
+    scheduler = _make_scheduler(services, state, executor, cb)
     # Set startup complete to skip startup logic
     scheduler._startup_complete = True
 
@@ -125,10 +158,37 @@ def test_periodic_interval_due(state, mock_executor, cb):
 
     scheduler.run_phase("periodic")
 
-    mock_executor.run_function.assert_called_once()
+    assert executor.function_calls == ["sync"]
+
+
+def test_periodic_interval_reschedules_after_run(
+    state, executor, cb, monkeypatch,
+):
+    """After running, a service should only be due again one interval later."""
+    services = [
+        ServiceConfig(
+            id="sync",
+            phase="periodic",
+            order=10,
+            schedule={"type": "interval", "interval": 60, "run_on_startup": False},
+            execution={"type": "function", "function": "svc_sync"},
+        ),
+    ]
+    scheduler = _make_scheduler(services, state, executor, cb)
+    scheduler._startup_complete = True
+    state.get("sync").last_run = time.time() - 120
+
+    scheduler.run_phase("periodic")
+    scheduler.run_phase("periodic")
+    assert executor.function_calls == ["sync"]
+
+    later = time.time() + 61
+    monkeypatch.setattr("wiggum_orchestrator.service_scheduler.time.time", lambda: later)
+    scheduler.run_phase("periodic")
+    assert executor.function_calls == ["sync", "sync"]
 
 
-def test_periodic_interval_not_due(state, mock_executor, cb):
+def test_periodic_interval_not_due(state, executor, cb):
     """Periodic service should not run before interval elapsed."""
     services = [
         ServiceConfig(
@@ -139,17 +199,17 @@ def test_periodic_interval_not_due(state, mock_executor, cb):
             execution={"type": "function", "function": "svc_sync"},
         ),
     ]
-    scheduler = _make_scheduler(services, state, mock_executor, cb)
+    scheduler = _make_scheduler(services, state, executor, cb)
     scheduler._startup_complete = True
 
     # Just ran recently
     state.get("sync").last_run = time.time()
 
     scheduler.run_phase("periodic")
-    mock_executor.run_function.assert_not_called()
+    assert executor.function_calls == []
 
 
-def test_periodic_circuit_breaker_blocks(state, mock_executor, cb):
+def test_periodic_circuit_breaker_blocks(state, executor, cb):
     """Circuit breaker open should block periodic service."""
     services = [
         ServiceConfig(
@@ -161,7 +221,7 @@ def test_periodic_circuit_breaker_blocks(state, mock_executor, cb):
             circuit_breaker={"enabled": True, "threshold": 3, "cooldown": 300},
         ),
     ]
-    scheduler = _make_scheduler(services, state, mock_executor, cb)
+    scheduler = _make_scheduler(services, state, executor, cb)
     scheduler._startup_complete = True
 
     # Open circuit breaker
@@ -171,10 +231,59 @@ def test_periodic_circuit_breaker_blocks(state, mock_executor, cb):
     entry.circuit_opened_at = time.time()  # just opened
 
     scheduler.run_phase("periodic")
-    mock_executor.run_function.assert_not_called()
+    assert executor.function_calls == []
+
+
+def test_periodic_circuit_cooldown_elapsed_runs(state, executor, cb):
+    """An open circuit past its cooldown should allow a half-open probe."""
+    services = [
+        ServiceConfig(
+            id="sync",
+            phase="periodic",
+            order=10,
+            schedule={"type": "interval", "interval": 60, "run_on_startup": False},
+            execution={"type": "function", "function": "svc_sync"},
+            circuit_breaker={"enabled": True, "threshold": 3, "cooldown": 300},
+        ),
+    ]
+    scheduler = _make_scheduler(services, state, executor, cb)
+    scheduler._startup_complete = True
+
+    entry = state.get("sync")
+    entry.last_run = time.time() - 120
+    entry.circuit_state = "open"
+    entry.circuit_opened_at = time.time() - 600  # cooldown elapsed
+
+    scheduler.run_phase("periodic")
+    assert executor.function_calls == ["sync"]
+    assert entry.circuit_state == "closed"  # probe succeeded
+
+
+def test_periodic_not_due_skips_circuit_check(state, executor, cb):
+    """A service that is not due should not consume half-open attempts."""
+    services = [
+        ServiceConfig(
+            id="sync",
+            phase="periodic",
+            order=10,
+            schedule={"type": "interval", "interval": 60, "run_on_startup": False},
+            execution={"type": "function", "function": "svc_sync"},
+            circuit_breaker={"enabled": True, "threshold": 3, "cooldown": 300},
+        ),
+    ]
+    scheduler = _make_scheduler(services, state, executor, cb)
+    scheduler._startup_complete = True
+
+    entry = state.get("sync")
+    entry.last_run = time.time()  # not due
+    entry.circuit_state = "half-open"
+
+    scheduler.run_phase("periodic")
+    assert executor.function_calls == []
+    assert entry.half_open_attempts == 0
 
 
-def test_periodic_concurrency_skip(state, mock_executor, cb):
+def test_periodic_concurrency_skip(state, executor, cb):
     """Running service with max_instances=1 should be skipped."""
     services = [
         ServiceConfig(
@@ -186,7 +295,7 @@ def test_periodic_concurrency_skip(state, mock_executor, cb):
             concurrency={"max_instances": 1, "if_running": "skip"},
         ),
     ]
-    scheduler = _make_scheduler(services, state, mock_executor, cb)
+    scheduler = _make_scheduler(services, state, executor, cb)
     scheduler._startup_complete = True
 
     entry = state.get("sync")
@@ -197,10 +306,10 @@ def test_periodic_concurrency_skip(state, mock_executor, cb):
     # Mock is_running to return True
     with patch.object(state, "is_running", return_value=True):
         scheduler.run_phase("periodic")
-    mock_executor.run_function.assert_not_called()
+    assert executor.function_calls == []
 
 
-def test_disabled_service_skipped(state, mock_executor, cb):
+def test_disabled_service_skipped(state, executor, cb):
     """Disabled services should not appear in phase dispatch."""
     services = [
         ServiceConfig(
@@ -218,13 +327,13 @@ def test_disabled_service_skipped(state, mock_executor, cb):
             execution={"type": "function", "function": "svc_disabled"},
         ),
     ]
-    scheduler = _make_scheduler(services, state, mock_executor, cb)
+    scheduler = _make_scheduler(services, state, executor, cb)
     scheduler.run_phase("startup")
 
-    mock_executor.run_phase.assert_called_once_with("startup", ["svc_active"])
+    assert executor.phase_calls == [("startup", ["svc_active"])]
 
 
-def test_condition_env_not_equals(state, mock_executor, cb):
+def test_condition_env_not_equals(state, executor, cb):
     """Services with unmet env conditions should be skipped."""
     import os
     os.environ["WIGGUM_RUN_MODE"] = "merge-only"
@@ -239,16 +348,40 @@ def test_condition_env_not_equals(state, mock_executor, cb):
                 condition={"env_not_equals": {"WIGGUM_RUN_MODE": "merge-only"}},
             ),
         ]
-        scheduler = _make_scheduler(services, state, mock_executor, cb)
+        scheduler = _make_scheduler(services, state, executor, cb)
         scheduler._startup_complete = True
         state.get("fix").last_run = time.time() - 120
 
         scheduler.run_phase("periodic")
-        mock_executor.run_function.assert_not_called()
+        assert executor.function_calls == []
     finally:
         os.environ.pop("WIGGUM_RUN_MODE", None)
 
 
+def test_condition_env_snapshot_refreshed_per_phase(
+    state, executor, cb, monkeypatch,
+):
+    """Env changes should be seen by the next run_phase call."""
+    services = [
+        ServiceConfig(
+            id="fix",
+            phase="pre",
+            order=10,
+            execution={"type": "function", "function": "svc_fix"},
+            condition={"env_not_equals": {"WIGGUM_RUN_MODE": "merge-only"}},
+        ),
+    ]
+    scheduler = _make_scheduler(services, state, executor, cb)
+    monkeypatch.delenv("WIGGUM_RUN_MODE", raising=False)
+
+    scheduler.run_phase("pre")
+    assert executor.phase_calls == [("pre", ["svc_fix"])]
+
+    monkeypatch.setenv("WIGGUM_RUN_MODE", "merge-only")
+    scheduler.run_phase("pre")
+    assert executor.phase_calls == [("pre", ["svc_fix"])]  # no new call
+
+
 # =============================================================================
 # Event system tests
 # =============================================================================
@@ -281,7 +414,7 @@ def test_trigger_matches_event_no_match():
     ) is False
 
 
-def test_event_service_triggered_on_success(state, mock_executor, cb):
+def test_event_service_triggered_on_success(state, executor, cb):
     """Event chain should fire after function completes with rc=0."""
     # memory-extract (interval) triggers memory-analyze (event) on success
     services = [
@@ -300,25 +433,21 @@ def test_event_service_triggered_on_success(state, mock_executor, cb):
             execution={"type": "function", "function": "svc_memory_analyze"},
         ),
     ]
-    scheduler = _make_scheduler(services, state, mock_executor, cb)
+    scheduler = _make_scheduler(services, state, executor, cb)
     scheduler._startup_complete = True
 
     # Make memory-extract due
     state.get("memory-extract").last_run = time.time() - 120
 
-    # run_function returns 0 (success) for both calls
-    mock_executor.run_function.return_value = 0
-
     scheduler.run_phase("periodic")
 
     # Both services should have been called
-    calls = mock_executor.run_function.call_args_list
-    called_ids = [c.args[0].id for c in calls]
+    called_ids = executor.function_calls
     assert "memory-extract" in called_ids
     assert "memory-analyze" in called_ids
 
 
-def test_event_service_triggered_on_failure(state, mock_executor, cb):
+def test_event_service_triggered_on_failure(state, executor, cb):
     """on_finish (service.completed:) should fire on failure too."""
     services = [
         ServiceConfig(
@@ -336,24 +465,23 @@ def test_event_service_triggered_on_failure(state, mock_executor, cb):
             execution={"type": "function", "function": "svc_memory_complete"},
         ),
     ]
-    scheduler = _make_scheduler(services, state, mock_executor, cb)
+    scheduler = _make_scheduler(services, state, executor, cb)
     scheduler._startup_complete = True
 
     state.get("memory-analyze").last_run = time.time() - 120
 
     # First call (memory-analyze) fails, second call (memory-complete) succeeds
-    mock_executor.run_function.side_effect = [1, 0]
+    executor.function_rcs = [1, 0]
 
     scheduler.run_phase("periodic")
 
-    calls = mock_executor.run_function.call_args_list
-    called_ids = [c.args[0].id for c in calls]
+    called_ids = executor.function_calls
     assert "memory-analyze" in called_ids
     # service.completed fires on both success and failure
     assert "memory-complete" in called_ids
 
 
-def test_event_service_conditions_checked(state, mock_executor, cb):
+def test_event_service_conditions_checked(state, executor, cb):
     """Conditions should be evaluated before running event-triggered service."""
     services = [
         ServiceConfig(
@@ -373,24 +501,21 @@ def test_event_service_conditions_checked(state, mock_executor, cb):
             condition={"file_exists": "/nonexistent/path/that/does/not/exist.json"},
         ),
     ]
-    scheduler = _make_scheduler(services, state, mock_executor, cb)
+    scheduler = _make_scheduler(services, state, executor, cb)
     scheduler._startup_complete = True
 
     state.get("extract").last_run = time.time() - 120
-    mock_executor.run_function.return_value = 0
 
     scheduler.run_phase("periodic")
 
     # Only extract should run, analyze skipped due to conditions
-    calls = mock_executor.run_function.call_args_list
-    called_ids = [c.args[0].id for c in calls]
+    called_ids = executor.function_calls
     assert "extract" in called_ids
     assert "analyze" not in called_ids
 
 
-def test_pipeline_exec_type(state, mock_executor, cb):
+def test_pipeline_exec_type(state, executor, cb):
     """Pipeline exec type should call executor.run_pipeline."""
-    mock_executor.run_pipeline = MagicMock(return_value=0)
     services = [
         ServiceConfig(
             id="trigger-svc",
@@ -407,14 +532,11 @@ def test_pipeline_exec_type(state, mock_executor, cb):
             execution={"type": "pipeline", "pipeline": "test-pipeline"},
         ),
     ]
-    scheduler = _make_scheduler(services, state, mock_executor, cb)
+    scheduler = _make_scheduler(services, state, executor, cb)
     scheduler._startup_complete = True
 
     state.get("trigger-svc").last_run = time.time() - 120
-    mock_executor.run_function.return_value = 0
 
     scheduler.run_phase("periodic")
 
-    mock_executor.run_pipeline.assert_called_once()
-    called_svc = mock_executor.run_pipeline.call_args.args[0]
-    assert called_svc.id == "pipeline-svc"
+    assert executor.pipeline_calls == ["pipeline-svc"]
@@ -0,0 +1,105 @@
+"""Tests for service_executor.py — the NUL-delimited serve protocol."""
+
+import os
+import signal
+
+import pytest
+
+from wiggum_orchestrator.config import ServiceConfig
+from wiggum_orchestrator.service_executor import ServiceExecutor
+
+# Speaks the bridge's serve protocol; records each call as NUL-separated
+# "<mode> <func> [args...]" in $RALPH_DIR/<func>.out.
+_STUB_BRIDGE = r"""#!/usr/bin/env bash
+set -euo pipefail
+mode="$1"
+shift
+if [[ "$mode" == "serve" ]]; then
+    request=()
+    while IFS= read -r -d '' _arg; do
+        request+=("$_arg")
+    done
+    if [ "${#request[@]}" -eq 0 ]; then
+        touch "$RALPH_DIR/spare-eof"
+        exit 0
+    fi
+    set -- "${request[@]}"
+fi
+printf '%s\0' "$mode" "$@" > "$RALPH_DIR/$1.out"
+[[ "$1" != "svc_fail" ]] || exit 3
+"""
+
+
+@pytest.fixture()
+def dirs(tmp_path):
+    wiggum_home = tmp_path / "home"
+    bridge_dir = wiggum_home / "lib" / "orchestrator-py"
+    bridge_dir.mkdir(parents=True)
+    (bridge_dir / "bash-bridge.sh").write_text(_STUB_BRIDGE)
+    ralph_dir = tmp_path / "ralph"
+    project_dir = tmp_path / "project"
+    ralph_dir.mkdir()
+    project_dir.mkdir()
+    return wiggum_home, ralph_dir, project_dir
+
+
+@pytest.fixture()
+def executor(dirs):
+    wiggum_home, ralph_dir, project_dir = dirs
+    ex = ServiceExecutor(str(wiggum_home), str(ralph_dir), str(project_dir))
+    yield ex
+    ex.close()
+
+
+def _svc(func):
+    return ServiceConfig(id=func, execution={"type": "function", "function": func})
+
+
+def _call(ralph_dir, func):
+    return (ralph_dir / f"{func}.out").read_bytes().decode().split("\0")[:-1]
+
+
+def test_spare_round_trips_arguments(executor, dirs):
+    """The spare receives the function name and arguments unchanged."""
+    ralph_dir = dirs[1]
+    args = ["two words", "line\nbreak", "", "tab\there", "ünïcode"]
+
+    assert executor.run_function(_svc("svc_first"), args) == 0
+    assert _call(ralph_dir, "svc_first") == ["function", "svc_first", *args]
+
+    assert executor.run_function(_svc("svc_second"), args) == 0
+    assert _call(ralph_dir, "svc_second") == ["serve", "svc_second", *args]
+
+
+def test_spare_exit_code_is_returned(executor):
+    """The served call's exit status is the run_function result."""
+    executor.run_function(_svc("svc_first"))
+    assert executor.run_function(_svc("svc_fail")) == 3
+
+
+def test_cold_fallback_when_spare_died(executor, dirs):
+    """A spare that exited before its request is replaced by a cold call."""
+    ralph_dir = dirs[1]
+    executor.run_function(_svc("svc_first"))
+    spare = executor._spare
+    spare.send_signal(signal.SIGKILL)
+    spare.wait()
+
+    assert executor.run_function(_svc("svc_second"), ["x"]) == 0
+    assert _call(ralph_dir, "svc_second") == ["function", "svc_second", "x"]
+    # A fresh spare is started for the next call
+    assert executor._spare is not None
+    assert executor._spare is not spare
+    assert executor._spare.poll() is None
+
+
+def test_close_sends_eof(executor, dirs):
+    """close() releases the idle spare with EOF and no request."""
+    ralph_dir = dirs[1]
+    executor.run_function(_svc("svc_first"))
+    spare = executor._spare
+
+    executor.close()
+    assert executor._spare is None
+    assert spare.returncode == 0
+    assert os.path.exists(ralph_dir / "spare-eof")
@@ -1,10 +1,12 @@
 """Tests for service_state.py — state persistence and lifecycle marks."""
 
 import json
+import os
 import time
 
 import pytest
 
+from wiggum_orchestrator import service_state
 from wiggum_orchestrator.service_state import ServiceState
 
 
@@ -73,6 +75,19 @@ def test_backoff(state):
     assert state.is_in_backoff("test-svc") is False
 
 
+def test_marks_use_supplied_time(state):
+    """A caller-sampled ``now`` replaces the per-call clock read."""
+    state.mark_started("test-svc", now=1000.0)
+    state.mark_completed("test-svc", now=1005.0)
+    state.set_backoff("test-svc", 10.0, now=1005.0)
+
+    entry = state.get("test-svc")
+    assert entry.last_run == 1000.0
+    assert entry.last_success == 1005.0
+    assert state.is_in_backoff("test-svc", now=1014.0) is True
+    assert state.is_in_backoff("test-svc", now=1015.0) is False
+
+
 def test_record_execution(state):
     state.record_execution("test-svc", 150, 0)
     entry = state.get("test-svc")
@@ -87,6 +102,13 @@ def test_record_execution(state):
     assert entry.total_duration_ms == 200
 
 
+def test_record_execution_keeps_zero_ms_minimum(state):
+    """A 0 ms run is a real minimum, not the 'no runs yet' marker."""
+    state.record_execution("test-svc", 0, 0)
+    state.record_execution("test-svc", 40, 0)
+    assert state.get("test-svc").min_duration_ms == 0
+
+
 def test_save_and_restore(state, tmp_path):
     state.mark_started("svc-a", pid=99999)
     state.mark_completed("svc-a")
@@ -151,8 +173,186 @@ def test_save_if_dirty(state):
     state.save_if_dirty()
 
 
+def test_flush_appends_between_compactions(state, tmp_path):
+    """Flushes after the first compaction append to state.wal only."""
+    state.mark_started("svc-a")
+    state.flush()  # first flush writes state.json
+    state_file = tmp_path / "services" / "state.json"
+    before = state_file.read_text()
+
+    state.mark_completed("svc-a")
+    state.record_execution("svc-a", 50, 0)
+    state.flush()
+
+    assert state_file.read_text() == before
+    lines = (tmp_path / "services" / "state.wal").read_text().splitlines()
+    assert len(lines) == 2
+    # Header names the state.json the log extends
+    assert json.loads(lines[0])["generation"] == json.loads(before)["generation"]
+    assert json.loads(lines[1])["id"] == "svc-a"
+
+
+def test_save_skips_unchanged_services(state, tmp_path):
+    """A save with identical services leaves state.json alone but still drops the log."""
+    state.mark_started("svc-a", now=1000.0)
+    state.save()
+    state_file = tmp_path / "services" / "state.json"
+    inode = state_file.stat().st_ino
+
+    # Change then restore the entry; the log holds the intermediate value
+    state.get("svc-a").status = "failed"
+    state._touch("svc-a")
+    state.flush()
+    state.get("svc-a").status = "running"
+    state.mark_dirty()
+    state.save()
+
+    assert state_file.stat().st_ino == inode
+    assert not (tmp_path / "services" / "state.wal").exists()
+    assert state._dirty is False
+
+
+def test_save_if_dirty_coalesces_within_interval(tmp_path):
+    """Changes inside the flush interval wait for a later flush."""
+    state = ServiceState(str(tmp_path), flush_interval=60)
+    state.mark_started("svc-a")
+    state.save_if_dirty()
+    assert state._dirty is False
+
+    state.mark_completed("svc-a")
+    state.save_if_dirty()
+    assert state._dirty is True
+    assert not (tmp_path / "services" / "state.wal").exists()
+
+    state.flush()
+    assert state._dirty is False
+
+
+def test_restore_removes_orphaned_temp_files(state, tmp_path):
+    """Temp files left by an interrupted save are cleaned up on restore."""
+    state.mark_started("svc-a")
+    state.save()
+    orphan = tmp_path / "services" / ".state.json.abc123.tmp"
+    orphan.write_text("{")
+
+    assert ServiceState(str(tmp_path)).restore() is True
+    assert not orphan.exists()
+    assert (tmp_path / "services" / "state.json").exists()
+
+
+def test_restore_replays_wal(state, tmp_path):
+    """restore() should apply log records written after the last save."""
+    state.mark_started("svc-a")
+    state.save()
+    state.mark_completed("svc-a")
+    state.record_execution("svc-a", 75, 0)
+    state.flush()
+    # Simulate a torn write from a crash
+    with open(tmp_path / "services" / "state.wal", "a") as f:
+        f.write('{"id": "svc-a", "serv')
+
+    state2 = ServiceState(str(tmp_path))
+    assert state2.restore() is True
+    a = state2.get("svc-a")
+    assert a.success_count == 1
+    assert a.total_duration_ms == 75
+
+    # Next flush folds the log back into state.json
+    state2.flush()
+    assert not (tmp_path / "services" / "state.wal").exists()
+
+
+def test_restore_ignores_wal_after_state_rewrite(state, tmp_path):
+    """A log left by a crash is dropped once bash has rewritten state.json."""
+    state.mark_started("svc-a", now=1000.0)
+    state.save()
+    state.mark_completed("svc-a")
+    state.record_execution("svc-a", 75, 0)
+    state.flush()
+    wal = tmp_path / "services" / "state.wal"
+    assert wal.exists()
+
+    # bash restarts from state.json and saves newer values (no generation)
+    state_file = tmp_path / "services" / "state.json"
+    data = json.loads(state_file.read_text())
+    del data["generation"]
+    data["services"]["svc-a"]["last_run"] = 2000
+    data["services"]["svc-a"]["run_count"] = 5
+    state_file.write_text(json.dumps(data))
+
+    state2 = ServiceState(str(tmp_path))
+    assert state2.restore() is True
+    a = state2.get("svc-a")
+    assert a.last_run == 2000
+    assert a.run_count == 5
+    assert a.success_count == 0
+    assert not wal.exists()
+
+
 def test_is_running_dead_pid(state):
     """is_running should detect dead PIDs and reset status."""
     state.mark_started("test-svc", pid=999999999)  # unlikely to exist
     assert state.is_running("test-svc") is False
     assert state.get("test-svc").status == "stopped"
+
+
+def test_pidfd_closed_on_completion(state):
+    """The cached pidfd should be released once the service completes."""
+    state.mark_started("test-svc", pid=os.getpid())
+    assert state.is_running("test-svc") is True
+
+    state.mark_completed("test-svc")
+    assert state.get("test-svc").pidfd is None
+
+
+def test_is_running_reuses_recent_signal_probe(state, monkeypatch):
+    """Without a pidfd, a live signal-0 result is trusted for _ALIVE_TTL."""
+    state.mark_started("test-svc", pid=os.getpid())
+    entry = state.get("test-svc")
+    entry.set_pid(None)
+    entry.pid = os.getpid()
+    calls = []
+    real_kill = os.kill
+    monkeypatch.setattr(
+        service_state.os, "kill",
+        lambda pid, sig: calls.append(pid) or real_kill(pid, sig),
+    )
+
+    assert state.is_running("test-svc") is True
+    assert state.is_running("test-svc") is True
+    assert len(calls) == 1
+
+    entry.alive_at -= service_state._ALIVE_TTL
+    assert state.is_running("test-svc") is True
+    assert len(calls) == 2
+
+
+def test_bind_shares_entries_with_get(state):
+    """Entries addressed by position should be the same objects as get()."""
+    state.mark_started("svc-a")
+    state.bind(["svc-a", "svc-b"])
+
+    assert state.at(0) is state.get("svc-a")
+    assert state.at(0).run_count == 1
+
+    state.get("svc-b").last_run = 42.0
+    assert state.at(1).last_run == 42.0
+
+
+def test_flush_compacts_when_wal_grows(state, tmp_path, monkeypatch):
+    """A log past _COMPACT_RECORDS lines forces a state.json rewrite."""
+    monkeypatch.setattr(service_state, "_COMPACT_RECORDS", 2)
+    state.mark_started("svc-a")
+    state.flush()
+    wal = tmp_path / "services" / "state.wal"
+
+    state.mark_completed("svc-a")
+    state.mark_started("svc-b")
+    state.flush()
+    assert len(wal.read_text().splitlines()) == 3  # header + 2 records
+
+    state.mark_completed("svc-b")
+    state.flush()
+    assert not wal.exists()
+    data = json.loads((tmp_path / "services" / "state.json").read_text())
+    assert data["services"]["svc-b"]["status"] == "stopped"
@@ -1,9 +1,12 @@
 """Tests for worker_pool.py — PID tracking and persistence."""
 
 import os
+import subprocess
+import sys
 
 import pytest
 
+from wiggum_orchestrator.pid_probe import close_pidfd
 from wiggum_orchestrator.worker_pool import WorkerPool
 
 
@@ -50,6 +53,19 @@ def test_get_by_type(pool):
     assert fix_workers[0].task_id == "TASK-002"
 
 
+def test_readd_moves_type_index(pool):
+    pool.add(100, "main", "TASK-001")
+    pool.add(100, "fix", "TASK-001")
+
+    assert pool.count() == 1
+    assert pool.count("main") == 0
+    assert [w.pid for w in pool.get_by_type("fix")] == [100]
+
+    pool.remove(100)
+    assert pool.count("fix") == 0
+    assert pool.get_by_type("fix") == []
+
+
 def test_cleanup_finished(pool):
     # Use PIDs that definitely don't exist
     pool.add(999999991, "main", "TASK-001")
@@ -62,6 +78,66 @@ def test_cleanup_finished(pool):
     assert pool.count() == 0
 
 
+def test_cleanup_reaps_own_children(pool):
+    # An exited child is reaped (no zombie left) and keeps its exit code
+    proc = subprocess.Popen([sys.executable, "-c", "raise SystemExit(3)"])
+    pool.add(proc.pid, "main", "TASK-001")
+    os.waitid(os.P_PID, proc.pid, os.WEXITED | os.WNOWAIT)
+
+    completed = pool.cleanup_finished()
+    assert [(e.task_id, e.exit_code) for e in completed] == [("TASK-001", 3)]
+    with pytest.raises(ChildProcessError):
+        os.waitpid(proc.pid, os.WNOHANG)
+    assert pool.count() == 0
+
+
+def test_cleanup_keeps_running_children(pool):
+    proc = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(5)"])
+    try:
+        pool.add(proc.pid, "main", "TASK-001")
+        assert pool.cleanup_finished() == []
+        assert pool.count() == 1
+    finally:
+        proc.kill()
+        proc.wait()
+
+
+def test_cleanup_polls_foreign_pidfds(pool):
+    # Treat two children as foreign so only their pidfds are consulted
+    done = subprocess.Popen([sys.executable, "-c", "pass"])
+    running = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(5)"])
+    try:
+        pool.add(done.pid, "main", "TASK-001")
+        pool.add(running.pid, "main", "TASK-002")
+        pool._owned.clear()
+        if pool._workers[done.pid].pidfd is None:
+            pytest.skip("pidfd_open unavailable")
+        os.waitid(os.P_PID, done.pid, os.WEXITED | os.WNOWAIT)
+
+        completed = pool.cleanup_finished()
+        assert [e.task_id for e in completed] == ["TASK-001"]
+        assert pool.count() == 1
+    finally:
+        running.kill()
+        running.wait()
+        done.wait()
+
+
+def test_cleanup_without_pidfd_uses_proc_snapshot(pool, monkeypatch):
+    pool.add(os.getpid(), "main", "TASK-001")
+    pool.add(999999991, "fix", "TASK-002")
+    for entry in pool._workers.values():
+        close_pidfd(entry.pidfd)
+        entry.pidfd = None
+    monkeypatch.setattr(
+        "wiggum_orchestrator.worker_pool.live_pids", lambda: {os.getpid()}
+    )
+
+    completed = pool.cleanup_finished()
+    assert [e.task_id for e in completed] == ["TASK-002"]
+    assert pool.count() == 1
+
+
 def test_cleanup_preserves_running(pool):
     # Use our own PID (guaranteed to be running)
     our_pid = os.getpid()
@@ -98,6 +174,20 @@ def test_restore_skips_dead_pids(pool, tmp_path):
     assert pool2.count() == 0
 
 
+
+def test_restore_skips_pids_owned_by_other_users(pool, tmp_path, monkeypatch):
+    """A PID alive in /proc but rejected with EPERM was reused; drop it."""
+    pool.add(os.getpid(), "main", "TASK-001")
+    pool.save()
+
+    def kill(pid, sig):
+        raise PermissionError(pid)
+
+    monkeypatch.setattr(os, "kill", kill)
+    pool2 = WorkerPool(str(tmp_path))
+    assert pool2.restore() == 0
+    assert pool2.count() == 0
+
 def test_all_pids(pool):
     pool.add(100, "main", "TASK-001")
     pool.add(200, "fix", "TASK-002")
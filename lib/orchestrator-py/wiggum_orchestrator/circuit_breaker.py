@@ -36,8 +36,7 @@ class CircuitBreaker:
             return True  # still cooling down
 
         if entry.circuit_state == "half-open":
-            half_open_max = svc.circuit_breaker.get("half_open_requests", 1) if svc.circuit_breaker else 1
-            if entry.half_open_attempts < half_open_max:
+            if entry.half_open_attempts < svc.cb_half_open_requests:
                 entry.half_open_attempts += 1
                 return False  # allow test request
             return True  # block additional
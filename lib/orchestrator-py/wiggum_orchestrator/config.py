@@ -6,15 +6,54 @@ typed dataclasses used by the scheduler.
 
 from __future__ import annotations
 
-import json
+import os
+import sys
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
+from wiggum_orchestrator import json_codec
+
+
+# Defaults for the nested config dicts. Read-only; services that fall back
+# to one get their own copy (see _dict_or_default), since configs may be
+# edited in place (overrides, tests).
+_DEFAULT_SCHEDULE: Mapping[str, Any] = MappingProxyType({"type": "tick"})
+_DEFAULT_CONCURRENCY: Mapping[str, Any] = MappingProxyType({
+    "max_instances": 1,
+    "if_running": "skip",
+})
+_DEFAULT_RESTART_POLICY: Mapping[str, Any] = MappingProxyType({
+    "on_failure": "skip",
+    "max_retries": 2,
+})
+
+# Built-in groups, merged into each service's configured "groups".
+# Run modes and --no-* flags disable services by group (see _MODE_DISABLES).
+_DEFAULT_GROUPS: dict[str, frozenset[str]] = {
+    "fix-workers": frozenset(("fix",)),
+    "multi-pr-planner": frozenset(("fix",)),
+    "resolve-workers": frozenset(("merge",)),
+    "orphan-workspace": frozenset(("workspace-cleanup",)),
+    "resume-poll": frozenset(("resume",)),
+    "resume-decide": frozenset(("resume",)),
+    "github-issue-sync": frozenset(("sync",)),
+    "github-plan-sync": frozenset(("sync",)),
+    "pr-sync": frozenset(("sync",)),
+}
+
 
-@dataclass
+@dataclass(slots=True)
 class ServiceConfig:
-    """Configuration for a single service."""
+    """Configuration for a single service.
+
+    Derived fields (schedule_type, interval, exec_type, cb_enabled, ...) are
+    computed from the raw dicts at construction; call _derive() after
+    replacing ``schedule``, ``execution``, ``concurrency``,
+    ``circuit_breaker`` or ``condition``.
+    """
 
     id: str
     description: str = ""
@@ -22,74 +61,96 @@ class ServiceConfig:
     order: int = 0
     enabled: bool = True
     required: bool = False
-    schedule: dict[str, Any] = field(default_factory=lambda: {"type": "tick"})
+    schedule: dict[str, Any] = field(default_factory=lambda: dict(_DEFAULT_SCHEDULE))
     execution: dict[str, Any] = field(default_factory=dict)
-    concurrency: dict[str, Any] = field(default_factory=lambda: {
-        "max_instances": 1,
-        "if_running": "skip",
-    })
+    concurrency: dict[str, Any] = field(
+        default_factory=lambda: dict(_DEFAULT_CONCURRENCY),
+    )
     condition: dict[str, Any] | None = None
     circuit_breaker: dict[str, Any] | None = None
     triggers: dict[str, list[str]] | None = None
+    groups: frozenset[str] = field(default_factory=frozenset)
     timeout: int = 300
-    restart_policy: dict[str, Any] = field(default_factory=lambda: {
-        "on_failure": "skip",
-        "max_retries": 2,
-    })
-
-    @property
-    def schedule_type(self) -> str:
-        return self.schedule.get("type", "tick")
-
-    @property
-    def interval(self) -> int:
-        return self.schedule.get("interval", 0)
-
-    @property
-    def jitter(self) -> int:
-        return self.schedule.get("jitter", 0)
-
-    @property
-    def run_on_startup(self) -> bool:
-        return self.schedule.get("run_on_startup", False)
-
-    @property
-    def exec_type(self) -> str:
-        return self.execution.get("type", "function")
-
-    @property
-    def exec_function(self) -> str:
-        return self.execution.get("function", "")
-
-    @property
-    def exec_command(self) -> str:
-        return self.execution.get("command", "")
-
-    @property
-    def cb_enabled(self) -> bool:
-        if self.circuit_breaker is None:
-            return False
-        return self.circuit_breaker.get("enabled", False)
-
-    @property
-    def cb_threshold(self) -> int:
-        if self.circuit_breaker is None:
-            return 5
-        return self.circuit_breaker.get("threshold", 5)
-
-    @property
-    def cb_cooldown(self) -> int:
-        if self.circuit_breaker is None:
-            return 300
-        return self.circuit_breaker.get("cooldown", 300)
+    restart_policy: dict[str, Any] = field(
+        default_factory=lambda: dict(_DEFAULT_RESTART_POLICY),
+    )
+    # Position in the owning ServiceRegistry; used for O(1) state lookups.
+    state_index: int = field(default=-1, repr=False, compare=False)
+
+    # Derived from the raw dicts above (see _derive)
+    schedule_type: str = field(init=False, repr=False, compare=False)
+    interval: int = field(init=False, repr=False, compare=False)
+    jitter: int = field(init=False, repr=False, compare=False)
+    run_on_startup: bool = field(init=False, repr=False, compare=False)
+    exec_type: str = field(init=False, repr=False, compare=False)
+    exec_function: str = field(init=False, repr=False, compare=False)
+    exec_command: str = field(init=False, repr=False, compare=False)
+    cb_enabled: bool = field(init=False, repr=False, compare=False)
+    cb_threshold: int = field(init=False, repr=False, compare=False)
+    cb_cooldown: int = field(init=False, repr=False, compare=False)
+    cb_half_open_requests: int = field(init=False, repr=False, compare=False)
+    has_condition: bool = field(init=False, repr=False, compare=False)
+    skip_if_running: bool = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.groups = frozenset(self.groups) | _DEFAULT_GROUPS.get(
+            self.id, frozenset(),
+        )
+        self._derive()
+
+    def _derive(self) -> None:
+        """Precompute the fields the scheduler reads every tick."""
+        schedule = self.schedule
+        self.schedule_type = schedule.get("type", "tick")
+        self.interval = schedule.get("interval", 0)
+        self.jitter = schedule.get("jitter", 0)
+        self.run_on_startup = schedule.get("run_on_startup", False)
+
+        execution = self.execution
+        self.exec_type = execution.get("type", "function")
+        self.exec_function = execution.get("function", "")
+        self.exec_command = execution.get("command", "")
+
+        cb = self.circuit_breaker or {}
+        self.cb_enabled = cb.get("enabled", False)
+        self.cb_threshold = cb.get("threshold", 5)
+        self.cb_cooldown = cb.get("cooldown", 300)
+        self.cb_half_open_requests = cb.get("half_open_requests", 1)
+
+        self.has_condition = bool(self.condition)
+
+        concurrency = self.concurrency
+        self.skip_if_running = (
+            concurrency.get("max_instances", 1) <= 1
+            and concurrency.get("if_running", "skip") == "skip"
+        )
+
+
+def _raw_groups(raw: dict[str, Any]) -> frozenset[str]:
+    """Groups for a raw service dict, as ServiceConfig would resolve them."""
+    return frozenset(raw.get("groups", ())) | _DEFAULT_GROUPS.get(
+        raw["id"], frozenset(),
+    )
+
+
+def _dict_or_default(
+    raw: dict[str, Any], key: str, default: Mapping[str, Any],
+) -> dict[str, Any]:
+    """raw[key], or a fresh copy of default when it is missing or null.
+
+    Unlike raw.get(key, {...}), no dict is built when the key is present.
+    """
+    value = raw.get(key)
+    return dict(default) if value is None else value
 
 
 def _parse_service(raw: dict[str, Any], defaults: dict[str, Any]) -> ServiceConfig:
     """Parse a raw service dict into ServiceConfig."""
-    restart_policy = raw.get("restart_policy", defaults.get("restart_policy", {
-        "on_failure": "skip",
-        "max_retries": 2,
-    }))
+    restart_policy = raw.get("restart_policy")
+    if restart_policy is None:
+        restart_policy = _dict_or_default(
+            defaults, "restart_policy", _DEFAULT_RESTART_POLICY,
+        )
     timeout = raw.get("timeout", defaults.get("timeout", 300))
 
     return ServiceConfig(
@@ -99,29 +160,60 @@ def _parse_service(raw: dict[str, Any], defaults: dict[str, Any]) -> ServiceConf
         order=raw.get("order", 0),
         enabled=raw.get("enabled", True),
         required=raw.get("required", False),
-        schedule=raw.get("schedule", {"type": "tick"}),
-        execution=raw.get("execution", {}),
-        concurrency=raw.get("concurrency", {"max_instances": 1, "if_running": "skip"}),
+        schedule=_dict_or_default(raw, "schedule", _DEFAULT_SCHEDULE),
+        execution=raw.get("execution") or {},
+        concurrency=_dict_or_default(raw, "concurrency", _DEFAULT_CONCURRENCY),
         condition=raw.get("condition"),
         circuit_breaker=raw.get("circuit_breaker"),
         triggers=raw.get("triggers"),
+        groups=frozenset(raw.get("groups", ())),
         timeout=timeout,
         restart_policy=restart_policy,
     )
 
 
+# Raw JSON cache: path -> (st_mtime_ns, st_size, file bytes).
+# Entries are invalidated by stat mismatch. Every load decodes the cached
+# bytes afresh, so in-place edits (overrides, normalization) never leak
+# into the cache; decoding is several times cheaper than deep-copying a
+# parsed tree, and the file is not re-read.
+_RAW_CACHE: dict[str, tuple[int, int, bytes]] = {}
+
+
+def _load_json_cached(path: Path) -> Any:
+    """Parse a JSON file, reading it from disk only when it has changed."""
+    key = str(path)
+    st = os.stat(key)
+    cached = _RAW_CACHE.get(key)
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return json_codec.loads(cached[2])
+
+    with open(key, "rb") as f:
+        raw = f.read()
+    data = json_codec.loads(raw)
+    _RAW_CACHE[key] = (st.st_mtime_ns, st.st_size, raw)
+    return data
+
+
 def load_services(
     wiggum_home: str,
     ralph_dir: str,
+    run_mode: str | None = None,
+    no_flags: dict[str, bool] | None = None,
 ) -> list[ServiceConfig]:
     """Load service configs from config/services.json + .ralph/services.json.
 
+    File contents are cached and reused until the file's mtime or size
+    changes, so repeated loads skip file I/O.
+
     Args:
         wiggum_home: WIGGUM_HOME path.
         ralph_dir: RALPH_DIR path (.ralph directory).
+        run_mode: Optional run mode; see build_services().
+        no_flags: Optional --no-* flags, used together with run_mode.
 
     Returns:
-        List of ServiceConfig sorted by (phase_order, service order).
+        List of ServiceConfig in services.json order.
     """
     config_path = Path(wiggum_home) / "config" / "services.json"
     override_path = Path(ralph_dir) / "services.json"
@@ -129,17 +221,51 @@ def load_services(
     if not config_path.exists():
         raise FileNotFoundError(f"services.json not found: {config_path}")
 
-    with open(config_path) as f:
-        raw_config = json.load(f)
+    raw_config = _load_json_cached(config_path)
+    overrides = _load_json_cached(override_path) if override_path.exists() else None
+
+    return build_services(raw_config, overrides, run_mode, no_flags)
+
+
+def build_services(
+    raw_config: dict[str, Any],
+    overrides: dict[str, Any] | None = None,
+    run_mode: str | None = None,
+    no_flags: dict[str, bool] | None = None,
+) -> list[ServiceConfig]:
+    """Build service configs from parsed services.json data.
+
+    Overrides and run-mode filters are applied to the raw dicts, so when
+    run_mode is given, disabled services are dropped before a
+    ServiceConfig is ever built for them. The raw service dicts are
+    modified in place.
 
+    Args:
+        raw_config: Parsed config/services.json.
+        overrides: Parsed .ralph/services.json, if any.
+        run_mode: Optional run mode (see apply_run_mode_filters). When set,
+            only enabled services are returned.
+        no_flags: Optional --no-* flags, used together with run_mode.
+
+    Returns:
+        List of ServiceConfig in services.json order.
+    """
     defaults = raw_config.get("defaults", {})
-    services = [_parse_service(s, defaults) for s in raw_config.get("services", [])]
+    raw_services = raw_config.get("services", [])
 
     # Apply project overrides
-    if override_path.exists():
-        with open(override_path) as f:
-            overrides = json.load(f)
-        _apply_overrides(services, overrides)
+    if overrides:
+        _apply_overrides(raw_services, overrides)
+
+    # Drop services disabled by config, overrides or run mode
+    if run_mode is not None:
+        disabled = _disabled_by_run_mode(run_mode, no_flags or {})
+        raw_services = [
+            raw for raw in raw_services
+            if raw.get("enabled", True) and not (_raw_groups(raw) & disabled)
+        ]
+
+    services = [_parse_service(s, defaults) for s in raw_services]
 
     # Normalize triggers (on_complete/on_failure/on_finish -> schedule.trigger)
     _normalize_triggers(services)
@@ -148,22 +274,36 @@ def load_services(
 
 
 def _apply_overrides(
-    services: list[ServiceConfig],
+    raw_services: list[dict[str, Any]],
     overrides: dict[str, Any],
 ) -> None:
-    """Apply .ralph/services.json overrides in-place."""
-    by_id = {s.id: s for s in services}
+    """Apply .ralph/services.json overrides to raw service dicts in-place."""
+    by_id = {raw.get("id", ""): raw for raw in raw_services}
 
     for override in overrides.get("services", []):
-        sid = override.get("id", "")
-        if sid in by_id:
-            svc = by_id[sid]
-            if "enabled" in override:
-                svc.enabled = override["enabled"]
-            if "schedule" in override:
-                svc.schedule.update(override["schedule"])
-            if "concurrency" in override:
-                svc.concurrency.update(override["concurrency"])
+        raw = by_id.get(override.get("id", ""))
+        if raw is None:
+            continue
+        if "enabled" in override:
+            raw["enabled"] = override["enabled"]
+        if "schedule" in override:
+            raw["schedule"] = {
+                **raw.get("schedule", _DEFAULT_SCHEDULE),
+                **override["schedule"],
+            }
+        if "concurrency" in override:
+            raw["concurrency"] = {
+                **raw.get("concurrency", _DEFAULT_CONCURRENCY),
+                **override["concurrency"],
+            }
+
+
+# Trigger key -> event prefix, in the order patterns are emitted
+_TRIGGER_EVENT_PREFIXES = (
+    ("on_complete", "service.succeeded:"),
+    ("on_failure", "service.failed:"),
+    ("on_finish", "service.completed:"),
+)
 
 
 def _normalize_triggers(services: list[ServiceConfig]) -> None:
@@ -177,20 +317,43 @@ def _normalize_triggers(services: list[ServiceConfig]) -> None:
         triggers: { on_finish: ["Z"] }   -> schedule: { type: "event", trigger: ["service.completed:Z"] }
     """
     for svc in services:
-        if svc.triggers is None:
+        if not svc.triggers:
             continue
 
-        trigger_list: list[str] = []
-        for svc_id in svc.triggers.get("on_complete", []):
-            trigger_list.append(f"service.succeeded:{svc_id}")
-        for svc_id in svc.triggers.get("on_failure", []):
-            trigger_list.append(f"service.failed:{svc_id}")
-        for svc_id in svc.triggers.get("on_finish", []):
-            trigger_list.append(f"service.completed:{svc_id}")
-
+        trigger_list = [
+            prefix + svc_id
+            for key, prefix in _TRIGGER_EVENT_PREFIXES
+            for svc_id in svc.triggers.get(key, ())
+        ]
         if trigger_list:
             svc.schedule = {"type": "event", "trigger": trigger_list}
-            svc.triggers = None
+            svc._derive()
+        svc.triggers = None
+
+
+# Service groups disabled by each run mode and --no-* flag
+_MODE_DISABLES: dict[str, frozenset[str]] = {
+    "merge-only": frozenset(("fix",)),
+    "resume-only": frozenset(("fix", "merge", "workspace-cleanup")),
+}
+_FLAG_DISABLES: dict[str, frozenset[str]] = {
+    "no_resume": frozenset(("resume",)),
+    "no_fix": frozenset(("fix",)),
+    "no_merge": frozenset(("merge",)),
+    "no_sync": frozenset(("sync",)),
+}
+
+
+def _disabled_by_run_mode(
+    run_mode: str,
+    no_flags: dict[str, bool],
+) -> frozenset[str]:
+    """Return the service groups disabled by a run mode and --no-* flags."""
+    disabled = _MODE_DISABLES.get(run_mode, frozenset())
+    for flag, ids in _FLAG_DISABLES.items():
+        if no_flags.get(flag):
+            disabled = disabled | ids
+    return disabled
 
 
 def apply_run_mode_filters(
@@ -208,33 +371,10 @@ def apply_run_mode_filters(
     Returns:
         Same list (modified in-place) with .enabled toggled.
     """
-    by_id = {s.id: s for s in services}
-
-    if run_mode == "merge-only":
-        for sid in ("fix-workers", "multi-pr-planner"):
-            if sid in by_id:
-                by_id[sid].enabled = False
-    elif run_mode == "resume-only":
-        for sid in ("fix-workers", "multi-pr-planner", "resolve-workers",
-                     "orphan-workspace"):
-            if sid in by_id:
-                by_id[sid].enabled = False
-
-    if no_flags.get("no_resume"):
-        for sid in ("resume-poll", "resume-decide"):
-            if sid in by_id:
-                by_id[sid].enabled = False
-    if no_flags.get("no_fix"):
-        for sid in ("fix-workers", "multi-pr-planner"):
-            if sid in by_id:
-                by_id[sid].enabled = False
-    if no_flags.get("no_merge"):
-        if "resolve-workers" in by_id:
-            by_id["resolve-workers"].enabled = False
-    if no_flags.get("no_sync"):
-        for sid in ("github-issue-sync", "github-plan-sync", "pr-sync"):
-            if sid in by_id:
-                by_id[sid].enabled = False
+    disabled = _disabled_by_run_mode(run_mode, no_flags)
+    for svc in services:
+        if svc.groups & disabled:
+            svc.enabled = False
 
     return services
 
@@ -249,41 +389,173 @@ _PHASE_ORDER = {
 }
 
 
+def _dispatch_key(svc: ServiceConfig) -> tuple[int, int]:
+    """Sort key grouping services by phase, then ascending order."""
+    return (_PHASE_ORDER.get(svc.phase, len(_PHASE_ORDER)), svc.order)
+
+
 class ServiceRegistry:
     """In-memory registry of services with phase-based lookups."""
 
     def __init__(self, services: list[ServiceConfig]) -> None:
+        # Interned IDs make the many ID-keyed dict probes pointer compares
+        for svc in services:
+            svc.id = sys.intern(svc.id)
         self._services = {s.id: s for s in services}
-        self._by_phase: dict[str, list[ServiceConfig]] = {}
+        for index, svc in enumerate(self._services.values()):
+            svc.state_index = index
+        # service_id -> (completed, succeeded, failed) event names
+        self._completion_events = {
+            sid: (
+                sys.intern(f"service.completed:{sid}"),
+                sys.intern(f"service.succeeded:{sid}"),
+                sys.intern(f"service.failed:{sid}"),
+            )
+            for sid in self._services
+        }
+        self._by_phase: dict[str, tuple[ServiceConfig, ...]] = {}
+        # phase -> (function services, their svc_* names, any conditional)
+        self._phase_funcs: dict[
+            str, tuple[tuple[ServiceConfig, ...], tuple[str, ...], bool]
+        ] = {}
+        grouped: dict[str, list[ServiceConfig]] = {}
+        for svc in self._services.values():
+            for group in svc.groups:
+                grouped.setdefault(group, []).append(svc)
+        self._by_group = {g: tuple(svcs) for g, svcs in grouped.items()}
+        self._event_exact: dict[str, list[ServiceConfig]] = {}
+        self._event_prefix: list[tuple[str, ServiceConfig]] = []
+        self._event_rank: dict[str, int] = {}
+        self._event_cache: dict[str, tuple[ServiceConfig, ...]] = {}
         self._rebuild_phase_index()
 
     def _rebuild_phase_index(self) -> None:
-        self._by_phase = {}
-        for svc in self._services.values():
-            phase = svc.phase
-            if phase not in self._by_phase:
-                self._by_phase[phase] = []
-            self._by_phase[phase].append(svc)
-        # Sort each phase by order
-        for phase in self._by_phase:
-            self._by_phase[phase].sort(key=lambda s: s.order)
+        """Bucket enabled services by phase in dispatch order.
+
+        Buckets are sorted by order once here so per-tick lookups are a
+        single dict probe. Shutdown runs in reverse, with ties in reverse
+        config order as in bash. The event index is derived from the
+        periodic bucket, so it is rebuilt here too.
+        """
+        enabled = [s for s in self._services.values() if s.enabled]
+        enabled.sort(key=_dispatch_key)
+        # The sort is stable, so each phase's run is already in order
+        buckets: dict[str, list[ServiceConfig]] = {}
+        for svc in enabled:
+            buckets.setdefault(svc.phase, []).append(svc)
+        # Reverse the whole run, ties included, like bash's sort_by | tac
+        if "shutdown" in buckets:
+            buckets["shutdown"].reverse()
+        self._by_phase = {phase: tuple(svcs) for phase, svcs in buckets.items()}
+        self._phase_funcs = {}
+        for phase, svcs in self._by_phase.items():
+            func_svcs = tuple(
+                s for s in svcs if s.exec_type == "function" and s.exec_function
+            )
+            self._phase_funcs[phase] = (
+                func_svcs,
+                tuple(s.exec_function for s in func_svcs),
+                any(s.has_condition for s in func_svcs),
+            )
+        self._rebuild_event_index()
+
+    def _rebuild_event_index(self) -> None:
+        """Index event-scheduled periodic services by trigger pattern.
+
+        Exact patterns go into a dict keyed by event name; glob-suffix
+        patterns ("service.completed:*") are stored once with the trailing
+        "*" stripped. The fan-out of every registered service's completion
+        events is then resolved up front, so scheduler dispatch is a single
+        dict probe.
+        """
+        self._event_exact = {}
+        self._event_prefix = []
+        self._event_rank = {}
+        self._event_cache = {}
+        for rank, svc in enumerate(self.get_periodic_services()):
+            if svc.schedule_type != "event":
+                continue
+            self._event_rank[svc.id] = rank
+            triggers = svc.schedule.get("trigger", [])
+            if isinstance(triggers, str):
+                triggers = [triggers]
+            for pattern in triggers:
+                if pattern.endswith("*"):
+                    self._event_prefix.append((pattern[:-1], svc))
+                else:
+                    self._event_exact.setdefault(sys.intern(pattern), []).append(svc)
+        for events in self._completion_events.values():
+            for event in events:
+                self.services_for_event(event)
 
     def get(self, service_id: str) -> ServiceConfig | None:
         return self._services.get(service_id)
 
-    def get_phase_services(self, phase: str) -> list[ServiceConfig]:
-        """Get enabled services for a phase, sorted by order."""
-        return [s for s in self._by_phase.get(phase, []) if s.enabled]
+    def completion_events(self, service_id: str) -> tuple[str, str, str]:
+        """Get the (completed, succeeded, failed) event names for a service."""
+        events = self._completion_events.get(service_id)
+        if events is None:
+            events = (
+                f"service.completed:{service_id}",
+                f"service.succeeded:{service_id}",
+                f"service.failed:{service_id}",
+            )
+        return events
+
+    def services_for_event(self, event: str) -> tuple[ServiceConfig, ...]:
+        """Get enabled event-scheduled services triggered by an event.
+
+        Results are memoized per event name. Completion events of
+        registered services (service.{completed,succeeded,failed}:<id>) are
+        resolved when the index is built; any other name on first use.
+
+        Returns:
+            Matching services in periodic dispatch order, each at most once.
+        """
+        cached = self._event_cache.get(event)
+        if cached is not None:
+            return cached
+
+        matched = {s.id: s for s in self._event_exact.get(event, ())}
+        for prefix, svc in self._event_prefix:
+            if svc.id not in matched and event.startswith(prefix):
+                matched[svc.id] = svc
+        result = tuple(sorted(matched.values(), key=lambda s: self._event_rank[s.id]))
+        self._event_cache[event] = result
+        return result
+
+    def get_phase_services(self, phase: str) -> tuple[ServiceConfig, ...]:
+        """Get enabled services for a phase in dispatch order.
+
+        Sorted by order, except shutdown which is sorted in reverse.
+        """
+        return self._by_phase.get(phase, ())
+
+    def get_group(self, group: str) -> tuple[ServiceConfig, ...]:
+        """Get all services (enabled or not) in a group."""
+        return self._by_group.get(group, ())
+
+    def get_phase_functions(
+        self, phase: str,
+    ) -> tuple[tuple[ServiceConfig, ...], tuple[str, ...], bool]:
+        """Get a phase's function-type services for a single bridge call.
+
+        Returns:
+            (services, svc_* function names in the same order, whether any
+            of those services has a condition to check before running).
+        """
+        return self._phase_funcs.get(phase, ((), (), False))
 
     def get_enabled(self) -> list[ServiceConfig]:
         """Get all enabled services."""
         return [s for s in self._services.values() if s.enabled]
 
-    def get_periodic_services(self) -> list[ServiceConfig]:
+    def get_periodic_services(self) -> tuple[ServiceConfig, ...]:
         """Get enabled periodic services (interval/cron/event scheduled)."""
-        return [s for s in self.get_phase_services("periodic") if s.enabled]
+        return self._by_phase.get("periodic", ())
 
     def all_ids(self) -> list[str]:
+        """Get all service IDs, ordered by state_index."""
         return list(self._services.keys())
 
     def count(self) -> int:
@@ -0,0 +1,27 @@
+"""JSON encode/decode — orjson when installed, stdlib otherwise.
+
+orjson is optional (the package has no runtime dependencies); it parses
+and emits bytes directly and is several times faster than the stdlib.
+Both backends produce identical compact output and raise
+json.JSONDecodeError (a ValueError) on bad input.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on environment
+    orjson = None
+
+if orjson is not None:
+    dumps = orjson.dumps
+    loads = orjson.loads
+else:  # pragma: no cover - depends on environment
+    def dumps(obj: Any) -> bytes:
+        """Encode compactly to bytes (one-shot C encoder, not json.dump)."""
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+    loads = json.loads
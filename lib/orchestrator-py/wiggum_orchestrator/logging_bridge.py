@@ -2,75 +2,123 @@
 
 Format: [YYYY-MM-DD HH:MM:SS] LEVEL: message
 Writes to both stderr and LOG_FILE (if set).
+
+LOG_FILE is held open in line-buffered append mode between calls. Bash
+log rotation truncates files in place, so the handle stays valid.
 """
 
 from __future__ import annotations
 
+import atexit
 import os
 import sys
 import time
+from typing import TextIO
+
 
+# Numeric severity of each bash LOG_LEVEL
+_TRACE = 0
+_DEBUG = 1
+_INFO = 2
+_WARN = 3
+_ERROR = 4
 
-# Map bash LOG_LEVEL names to numeric severity
 _LEVEL_VALUES = {
-    "TRACE": 0,
-    "DEBUG": 1,
-    "INFO": 2,
-    "WARN": 3,
-    "ERROR": 4,
+    "TRACE": _TRACE,
+    "DEBUG": _DEBUG,
+    "INFO": _INFO,
+    "WARN": _WARN,
+    "ERROR": _ERROR,
 }
 
-_min_level: int = 2  # INFO by default
+_min_level: int = _INFO
 _log_file: str | None = None
+_log_fp: TextIO | None = None
 
 
 def init(log_level: str | None = None, log_file: str | None = None) -> None:
     """Initialize logging from env or explicit args."""
-    global _min_level, _log_file
+    global _min_level, _log_file, _log_fp
 
     level = log_level or os.environ.get("LOG_LEVEL", "INFO")
     if os.environ.get("DEBUG") == "1" and level not in ("TRACE", "DEBUG"):
         level = "DEBUG"
-    _min_level = _LEVEL_VALUES.get(level.upper(), 2)
+    _min_level = _LEVEL_VALUES.get(level.upper(), _INFO)
     _log_file = log_file or os.environ.get("LOG_FILE")
 
+    # Re-init replaces any previously opened handle
+    _close_log_file()
+    if _log_file:
+        try:
+            _log_fp = open(_log_file, "a", buffering=1)
+        except OSError:
+            _log_fp = None
+
+
+def _close_log_file() -> None:
+    global _log_fp
+    if _log_fp is not None:
+        try:
+            _log_fp.close()
+        except OSError:
+            pass
+        _log_fp = None
+
+
+atexit.register(_close_log_file)
+
+
+# "[YYYY-MM-DD HH:MM:SS]" prefix, rebuilt only when the second changes
+_ts_sec: int = -1
+_ts_prefix: str = ""
+
 
 def _format(level: str, msg: str) -> str:
-    ts = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())
-    return f"[{ts}] {level}: {msg}"
+    global _ts_sec, _ts_prefix
+    sec = int(time.time())
+    if sec != _ts_sec:
+        _ts_sec = sec
+        _ts_prefix = time.strftime("[%Y-%m-%d %H:%M:%S]", time.localtime(sec))
+    return f"{_ts_prefix} {level}: {msg}"
 
 
 def _emit(level: str, msg: str) -> None:
-    level_val = _LEVEL_VALUES.get(level, 2)
-    if level_val < _min_level:
-        return
+    """Write a line that has already passed the level check."""
     line = _format(level, msg)
     # INFO goes to stdout, others to stderr (matching bash logger)
     stream = sys.stdout if level == "INFO" else sys.stderr
     print(line, file=stream, flush=True)
-    if _log_file:
+    if _log_fp is not None:
         try:
-            with open(_log_file, "a") as f:
-                f.write(line + "\n")
+            _log_fp.write(line + "\n")
         except OSError:
             pass
 
 
+# Level checks are inlined so suppressed messages skip the _emit call
+# and timestamp formatting entirely.
+
+
 def log(msg: str) -> None:
-    _emit("INFO", msg)
+    if _min_level <= _INFO:
+        _emit("INFO", msg)
 
 
 def log_debug(msg: str) -> None:
-    _emit("DEBUG", msg)
+    if _min_level <= _DEBUG:
+        _emit("DEBUG", msg)
 
 
 def log_warn(msg: str) -> None:
-    _emit("WARN", msg)
+    if _min_level <= _WARN:
+        _emit("WARN", msg)
 
 
 def log_error(msg: str) -> None:
-    _emit("ERROR", msg)
+    if _min_level <= _ERROR:
+        _emit("ERROR", msg)
 
 
 def log_trace(msg: str) -> None:
-    _emit("TRACE", msg)
+    if _min_level <= _TRACE:
+        _emit("TRACE", msg)
@@ -10,11 +10,7 @@ import threading
 
 from wiggum_orchestrator import logging_bridge as log
 from wiggum_orchestrator.circuit_breaker import CircuitBreaker
-from wiggum_orchestrator.config import (
-    ServiceRegistry,
-    apply_run_mode_filters,
-    load_services,
-)
+from wiggum_orchestrator.config import ServiceRegistry, load_services
 from wiggum_orchestrator.service_executor import ServiceExecutor
 from wiggum_orchestrator.service_scheduler import ServiceScheduler
 from wiggum_orchestrator.service_state import ServiceState
@@ -123,6 +119,12 @@ def _parse_args() -> argparse.Namespace:
         default=5.0,
         help="Seconds between main loop ticks (default: 5)",
     )
+    parser.add_argument(
+        "--state-flush-interval",
+        type=float,
+        default=1.0,
+        help="Minimum seconds between service state writes (default: 1)",
+    )
     return parser.parse_args()
 
 
@@ -226,22 +228,20 @@ def run(args: argparse.Namespace) -> int:
 
     log.log("Python orchestrator starting")
 
-    # Load service configuration
-    services = load_services(wiggum_home, ralph_dir)
-
+    # Load service configuration (disabled services are never built)
     no_flags = {
         "no_resume": args.no_resume,
         "no_fix": args.no_fix,
         "no_merge": args.no_merge,
         "no_sync": args.no_sync,
     }
-    services = apply_run_mode_filters(services, args.run_mode, no_flags)
+    services = load_services(wiggum_home, ralph_dir, args.run_mode, no_flags)
 
     registry = ServiceRegistry(services)
     log.log(f"Loaded {registry.count()} services")
 
     # Initialize state
-    state = ServiceState(ralph_dir)
+    state = ServiceState(ralph_dir, flush_interval=args.state_flush_interval)
     if state.restore():
         log.log("Restored previous service state")
 
@@ -303,6 +303,7 @@ def run(args: argparse.Namespace) -> int:
     log.log("Running startup phase...")
     if not scheduler.run_phase("startup"):
         log.log_error("Startup phase failed, aborting")
+        executor.close()
         _release_lock(pid_file)
         return 1
 
@@ -344,6 +345,7 @@ def run(args: argparse.Namespace) -> int:
     log.log("Running shutdown phase...")
     scheduler.run_phase("shutdown")
     _scheduler = None
+    executor.close()
     state.save()
     pool.save()
     _release_lock(pid_file)
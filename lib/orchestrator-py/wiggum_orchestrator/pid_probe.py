@@ -0,0 +1,88 @@
+"""PID liveness probes — pidfd-based with an os.kill(pid, 0) fallback.
+
+A pidfd (Linux 5.3+, Python 3.9+) refers to one specific process, so it
+cannot be fooled by PID reuse, and it becomes readable as soon as the
+process exits (including zombies that kill(pid, 0) still reports alive).
+"""
+
+from __future__ import annotations
+
+import os
+import select
+
+
+def open_pidfd(pid: int) -> int | None:
+    """Open a pidfd for a process.
+
+    Returns:
+        The pidfd, or None if pidfds are unsupported or the process is gone.
+    """
+    try:
+        return os.pidfd_open(pid)
+    except (AttributeError, OSError):
+        return None
+
+
+def close_pidfd(fd: int | None) -> None:
+    """Close a pidfd returned by open_pidfd (None is ignored)."""
+    if fd is None:
+        return
+    try:
+        os.close(fd)
+    except OSError:
+        pass
+
+
+def pidfd_exited(fd: int) -> bool:
+    """Return True if the process behind a pidfd has exited."""
+    poller = select.poll()
+    poller.register(fd, select.POLLIN)
+    return bool(poller.poll(0))
+
+
+def exited_pidfds(fds: list[int]) -> set[int]:
+    """Return the pidfds among fds whose processes have exited.
+
+    One poll() call regardless of how many pidfds are checked.
+    """
+    if not fds:
+        return set()
+    poller = select.poll()
+    for fd in fds:
+        poller.register(fd, select.POLLIN)
+    return {fd for fd, _ in poller.poll(0)}
+
+
+def pid_alive(pid: int) -> bool:
+    """Signal-0 liveness check; EPERM means the process exists."""
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def live_pids() -> set[int] | None:
+    """Snapshot every visible PID with one /proc directory read.
+
+    Returns:
+        The set of live PIDs, or None where /proc is unavailable (macOS).
+    """
+    try:
+        names = os.listdir("/proc")
+    except OSError:
+        return None
+    return {int(n) for n in names if n.isdigit()}
+
+
+def wait_pidfd(fd: int, timeout: float | None) -> bool:
+    """Block until the process behind a pidfd exits or timeout elapses.
+
+    Returns:
+        True if the process exited, False on timeout.
+    """
+    poller = select.poll()
+    poller.register(fd, select.POLLIN)
+    return bool(poller.poll(None if timeout is None else timeout * 1000))
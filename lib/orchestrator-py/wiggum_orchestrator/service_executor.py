@@ -4,16 +4,43 @@ Runs bash functions/commands via the bash-bridge.sh script. Two modes:
 
 - Phase mode: all functions in a phase run in one bash process (shared state).
 - Function mode: individual service runs in its own subprocess.
+
+Foreground functions are handed to a "serve" spare when one is ready, so
+the bridge's library sourcing overlaps the previous call instead of
+delaying this one. Each call still gets a fresh process, and the spare
+only loads config and pool state once its request arrives.
 """
 
 from __future__ import annotations
 
 import os
 import subprocess
-import threading
+from collections.abc import Sequence
 
 from wiggum_orchestrator import logging_bridge as log
 from wiggum_orchestrator.config import ServiceConfig
+from wiggum_orchestrator.pid_probe import close_pidfd, open_pidfd, wait_pidfd
+
+
+def _wait(proc: subprocess.Popen, timeout: float) -> int:
+    """Popen.wait(timeout) that sleeps on a pidfd instead of polling.
+
+    Popen.wait with a timeout wakes up every few ms to retry waitpid; a
+    pidfd wakes us exactly when the child exits. Falls back to Popen.wait
+    where pidfds are unavailable.
+
+    Raises:
+        subprocess.TimeoutExpired: Like Popen.wait.
+    """
+    fd = open_pidfd(proc.pid)
+    if fd is None:
+        return proc.wait(timeout=timeout)
+    try:
+        if not wait_pidfd(fd, timeout):
+            raise subprocess.TimeoutExpired(proc.args, timeout)
+    finally:
+        close_pidfd(fd)
+    return proc.wait()
 
 
 class ServiceExecutor:
@@ -31,8 +58,13 @@ class ServiceExecutor:
         )
         self._env = self._build_env(wiggum_home, ralph_dir, project_dir,
                                      env_overrides)
-        self._proc_lock = threading.Lock()
+        # Encoded once: Popen would otherwise fsencode every variable per spawn
+        self._env_bytes = {
+            os.fsencode(k): os.fsencode(v) for k, v in self._env.items()
+        }
+        self._cwd = self._env.get("PROJECT_DIR")
         self._current_proc: subprocess.Popen | None = None
+        self._spare: subprocess.Popen | None = None
 
     @staticmethod
     def _build_env(
@@ -49,24 +81,77 @@ class ServiceExecutor:
         # Ensure $WIGGUM_HOME/bin is on PATH so command-type services
         # (e.g. pr-sync running "wiggum-pr sync") can find CLI tools.
         bin_dir = os.path.join(wiggum_home, "bin")
-        path = env.get("PATH", "")
-        if bin_dir not in path.split(os.pathsep):
-            env["PATH"] = bin_dir + os.pathsep + path if path else bin_dir
+        parts = env["PATH"].split(os.pathsep) if env.get("PATH") else []
+        if bin_dir not in parts:
+            env["PATH"] = os.pathsep.join([bin_dir, *parts])
         if overrides:
             env.update(overrides)
         return env
 
+    def _spawn(self, cmd: list[str], **kwargs) -> subprocess.Popen:
+        """Popen with the bridge environment and project working directory.
+
+        CPython (3.10+) spawns these via vfork, so spawn cost does not grow
+        with orchestrator RSS. Passing preexec_fn, user/group or umask
+        arguments would fall back to fork(); keep them out.
+        """
+        return subprocess.Popen(cmd, env=self._env_bytes, cwd=self._cwd, **kwargs)
+
     def interrupt(self) -> None:
-        """Terminate the currently running foreground subprocess, if any."""
-        with self._proc_lock:
-            proc = self._current_proc
+        """Terminate the currently running foreground subprocess, if any.
+
+        Called from the signal handler, which runs on the main thread
+        between bytecodes — so _current_proc is a plain attribute (reference
+        stores are atomic) rather than lock-guarded: a lock held by the
+        interrupted code would deadlock here.
+        """
+        proc = self._current_proc
         if proc is not None:
             try:
                 proc.terminate()
             except ProcessLookupError:
                 pass
 
-    def run_phase(self, phase: str, functions: list[str]) -> bool:
+    def close(self) -> None:
+        """Release the idle bridge spare, if any."""
+        spare, self._spare = self._spare, None
+        if spare is None:
+            return
+        try:
+            spare.stdin.close()  # EOF without a request: spare exits 0
+            spare.wait(timeout=5)
+        except (OSError, subprocess.TimeoutExpired):
+            spare.kill()
+            spare.wait()
+
+    def _start_function(self, func: str, args: list[str]) -> subprocess.Popen:
+        """Start a foreground bridge function, preferring the warm spare.
+
+        Falls back to a cold "function" invocation if the spare is missing
+        or died during init, then starts the next spare.
+        """
+        proc = None
+        spare, self._spare = self._spare, None
+        if spare is not None and spare.poll() is None:
+            request = "\0".join([func, *args]) + "\0"
+            try:
+                spare.stdin.write(request.encode())
+                spare.stdin.close()
+                proc = spare
+            except OSError:
+                spare.kill()
+                spare.wait()
+        elif spare is not None:
+            log.log_debug(f"Bridge spare exited during init (exit {spare.returncode})")
+        if proc is None:
+            proc = self._spawn(["bash", self._bridge, "function", func, *args])
+        self._spare = self._spawn(
+            ["bash", self._bridge, "serve"],
+            stdin=subprocess.PIPE,
+        )
+        return proc
+
+    def run_phase(self, phase: str, functions: Sequence[str]) -> bool:
         """Run all phase functions in a single bash process.
 
         Args:
@@ -79,26 +164,20 @@ class ServiceExecutor:
         if not functions:
             return True
 
-        cmd = ["bash", self._bridge, "phase", phase] + functions
+        cmd = ["bash", self._bridge, "phase", phase, *functions]
         log.log_debug(f"Bridge phase {phase}: {' '.join(functions)}")
 
-        proc = subprocess.Popen(
-            cmd,
-            env=self._env,
-            cwd=self._env.get("PROJECT_DIR"),
-        )
-        with self._proc_lock:
-            self._current_proc = proc
+        proc = self._spawn(cmd)
+        self._current_proc = proc
         try:
-            proc.wait(timeout=600)
+            _wait(proc, 600)
         except subprocess.TimeoutExpired:
             proc.kill()
             proc.wait()
             log.log_error(f"Bridge phase {phase} timed out after 600s")
             return False
         finally:
-            with self._proc_lock:
-                self._current_proc = None
+            self._current_proc = None
         if proc.returncode != 0:
             log.log_error(
                 f"Bridge phase {phase} failed (exit {proc.returncode})",
@@ -125,29 +204,19 @@ class ServiceExecutor:
             log.log_error(f"Service {svc.id} has no function defined")
             return 1
 
-        cmd = ["bash", self._bridge, "function", func]
-        if extra_args:
-            cmd.extend(extra_args)
-
         log.log_debug(f"Bridge function: {func}")
         timeout = svc.timeout or 600
-        proc = subprocess.Popen(
-            cmd,
-            env=self._env,
-            cwd=self._env.get("PROJECT_DIR"),
-        )
-        with self._proc_lock:
-            self._current_proc = proc
+        proc = self._start_function(func, extra_args or [])
+        self._current_proc = proc
         try:
-            proc.wait(timeout=timeout)
+            _wait(proc, timeout)
         except subprocess.TimeoutExpired:
             proc.kill()
             proc.wait()
             log.log_warn(f"Service {svc.id} timed out after {timeout}s")
             return 124  # GNU timeout exit code
         finally:
-            with self._proc_lock:
-                self._current_proc = None
+            self._current_proc = None
         return proc.returncode
 
     def run_command(self, svc: ServiceConfig) -> int:
@@ -166,23 +235,17 @@ class ServiceExecutor:
 
         log.log_debug(f"Bridge command: {cmd_str}")
         timeout = svc.timeout or 600
-        proc = subprocess.Popen(
-            ["bash", "-c", cmd_str],
-            env=self._env,
-            cwd=self._env.get("PROJECT_DIR"),
-        )
-        with self._proc_lock:
-            self._current_proc = proc
+        proc = self._spawn(["bash", "-c", cmd_str])
+        self._current_proc = proc
         try:
-            proc.wait(timeout=timeout)
+            _wait(proc, timeout)
         except subprocess.TimeoutExpired:
             proc.kill()
             proc.wait()
             log.log_warn(f"Service {svc.id} timed out after {timeout}s")
             return 124  # GNU timeout exit code
         finally:
-            with self._proc_lock:
-                self._current_proc = None
+            self._current_proc = None
         return proc.returncode
 
     def run_pipeline(self, svc: ServiceConfig) -> int:
@@ -199,23 +262,17 @@ class ServiceExecutor:
         cmd = ["bash", self._bridge, "pipeline", svc.id, pipeline_name, use_workspace]
         log.log_debug(f"Bridge pipeline: {svc.id}")
         timeout = svc.timeout or 600
-        proc = subprocess.Popen(
-            cmd,
-            env=self._env,
-            cwd=self._env.get("PROJECT_DIR"),
-        )
-        with self._proc_lock:
-            self._current_proc = proc
+        proc = self._spawn(cmd)
+        self._current_proc = proc
         try:
-            proc.wait(timeout=timeout)
+            _wait(proc, timeout)
         except subprocess.TimeoutExpired:
             proc.kill()
             proc.wait()
             log.log_warn(f"Service {svc.id} pipeline timed out after {timeout}s")
             return 124
         finally:
-            with self._proc_lock:
-                self._current_proc = None
+            self._current_proc = None
         return proc.returncode
 
     def run_function_background(
@@ -234,10 +291,8 @@ class ServiceExecutor:
             cmd.extend(extra_args)
 
         log.log_debug(f"Bridge background: {func}")
-        proc = subprocess.Popen(
+        proc = self._spawn(
             cmd,
-            env=self._env,
-            cwd=self._env.get("PROJECT_DIR"),
             stdout=subprocess.DEVNULL,
             stderr=subprocess.DEVNULL,
         )
@@ -251,10 +306,8 @@ class ServiceExecutor:
         """
         cmd_str = svc.exec_command
         log.log_debug(f"Command background: {cmd_str}")
-        proc = subprocess.Popen(
+        proc = self._spawn(
             ["bash", "-c", cmd_str],
-            env=self._env,
-            cwd=self._env.get("PROJECT_DIR"),
             stdout=subprocess.DEVNULL,
             stderr=subprocess.DEVNULL,
         )
@@ -6,6 +6,8 @@ with in-memory scheduling (time.time() + dict lookup, zero forks).
 
 from __future__ import annotations
 
+import heapq
+import os
 import random
 import subprocess
 import time
@@ -14,7 +16,7 @@ from wiggum_orchestrator import logging_bridge as log
 from wiggum_orchestrator.circuit_breaker import CircuitBreaker
 from wiggum_orchestrator.config import ServiceConfig, ServiceRegistry
 from wiggum_orchestrator.service_executor import ServiceExecutor
-from wiggum_orchestrator.service_state import ServiceState
+from wiggum_orchestrator.service_state import ServiceEntry, ServiceState
 
 
 class ServiceScheduler:
@@ -34,6 +36,20 @@ class ServiceScheduler:
         self._state = state
         self._executor = executor
         self._cb = circuit_breaker
+        # Bind state entries to registry positions for index lookups
+        self._state.bind(registry.all_ids())
+        # Interval-scheduled periodic services paired with their state entry
+        self._interval_rows: list[tuple[ServiceConfig, ServiceEntry]] = [
+            (svc, state.at(svc.state_index))
+            for svc in registry.get_periodic_services()
+            if svc.schedule_type == "interval" and svc.interval > 0
+        ]
+        # Min-heap of (due_at, row index, last_run the key was computed
+        # from); built on the first periodic tick (see _select_due_periodic)
+        self._due_heap: list[tuple[float, int, float]] | None = None
+        # Env vars referenced by conditions, snapshotted once per phase run
+        self._env_keys = self._collect_env_keys(registry)
+        self._env_snapshot: dict[str, str | None] = {}
         self._startup_complete = False
         self._event_depth = 0
         # Background processes: service_id -> (Popen, ServiceConfig)
@@ -48,6 +64,8 @@ class ServiceScheduler:
         Returns:
             True on success, False if a required startup service fails.
         """
+        self._env_snapshot = {k: os.environ.get(k) for k in self._env_keys}
+
         if phase == "periodic":
             return self._tick_periodic()
 
@@ -55,38 +73,34 @@ class ServiceScheduler:
 
     def _run_tick_phase(self, phase: str) -> bool:
         """Run all tick-scheduled services in a phase via single bridge call."""
-        services = self._registry.get_phase_services(phase)
-        if not services:
-            return True
-
-        # Shutdown runs in reverse order
-        if phase == "shutdown":
-            services = list(reversed(services))
-
-        functions: list[str] = []
-        func_svc_map: list[ServiceConfig] = []
-
-        for svc in services:
-            if not self._conditions_met(svc):
-                log.log_debug(f"Phase {phase}: skipping {svc.id} (conditions)")
-                continue
-            if svc.exec_type == "function" and svc.exec_function:
-                functions.append(svc.exec_function)
-                func_svc_map.append(svc)
+        func_svc_map, functions, conditional = (
+            self._registry.get_phase_functions(phase)
+        )
+        if conditional:
+            kept = []
+            for svc in func_svc_map:
+                if svc.has_condition and not self._conditions_met(svc):
+                    log.log_debug(f"Phase {phase}: skipping {svc.id} (conditions)")
+                    continue
+                kept.append(svc)
+            func_svc_map = kept
+            functions = [svc.exec_function for svc in kept]
 
         if not functions:
             return True
 
-        # Mark all as started
+        # Mark all as started (one bridge call, so one start time)
+        now = time.time()
         for svc in func_svc_map:
-            self._state.mark_started(svc.id)
+            self._state.mark_started(svc.id, now=now)
 
         success = self._executor.run_phase(phase, functions)
 
         # Mark all as completed/failed based on bridge exit
+        now = time.time()
         for svc in func_svc_map:
             if success:
-                self._state.mark_completed(svc.id)
+                self._state.mark_completed(svc.id, now=now)
             else:
                 self._state.mark_failed(svc.id)
 
@@ -120,7 +134,7 @@ class ServiceScheduler:
         # Poll background processes for completion
         self._poll_background_procs()
 
-        for svc in self._registry.get_periodic_services():
+        for svc in self._select_due_periodic(now):
             if not self._should_run_periodic(svc, now):
                 continue
 
@@ -128,6 +142,58 @@ class ServiceScheduler:
 
         return True
 
+    def _due_key(self, row: int) -> tuple[float, int, float]:
+        """Heap key for a row: next due time based on its current last_run."""
+        svc, entry = self._interval_rows[row]
+        interval = svc.interval
+        if svc.jitter > 0:
+            interval += random.randint(0, svc.jitter)
+        return (entry.last_run + interval, row, entry.last_run)
+
+    def _select_due_periodic(self, now: float) -> list[ServiceConfig]:
+        """Return interval services that are due and not cooling down.
+
+        Pops only heap entries whose due time has passed, so a tick costs
+        O(k log n) for k due services instead of a scan of every service.
+        Keys are re-derived lazily: an entry whose last_run moved since its
+        key was computed (the service ran) is pushed back with a fresh key.
+        last_run is only expected to move forward once the heap is built.
+        Due entries are pushed back unchanged, so a service that is blocked
+        by a later gating check (half-open probes, backoff, conditions,
+        concurrency) is re-evaluated on the next tick, as is one still in
+        its open-circuit cooldown (keyed to the end of the cooldown).
+        """
+        heap = self._due_heap
+        if heap is None:
+            heap = [self._due_key(row) for row in range(len(self._interval_rows))]
+            heapq.heapify(heap)
+            self._due_heap = heap
+
+        due: list[ServiceConfig] = []
+        requeue: list[tuple[float, int, float]] = []
+        while heap and heap[0][0] <= now:
+            key = heapq.heappop(heap)
+            row = key[1]
+            svc, entry = self._interval_rows[row]
+            if entry.last_run != key[2]:
+                key = self._due_key(row)
+                if key[0] > now:
+                    heapq.heappush(heap, key)
+                    continue
+            # Open circuit still cooling down (cb.blocks() would say True)
+            if (svc.cb_enabled and entry.circuit_state == "open"
+                    and now - entry.circuit_opened_at < svc.cb_cooldown):
+                requeue.append(
+                    (entry.circuit_opened_at + svc.cb_cooldown, row, key[2]),
+                )
+                continue
+            due.append(svc)
+            requeue.append(key)
+
+        for key in requeue:
+            heapq.heappush(heap, key)
+        return due
+
     def _run_startup_services(self, now: float) -> None:
         """Run periodic services with run_on_startup on first tick.
 
@@ -149,51 +215,29 @@ class ServiceScheduler:
                 self._run_single_service(svc)
 
     def _should_run_periodic(self, svc: ServiceConfig, now: float) -> bool:
-        """Check if a periodic service should run this tick."""
+        """Check if a due periodic service may run this tick.
+
+        ``now`` is the tick time the service was found due at.
+        """
         # Circuit breaker
         if self._cb.blocks(svc):
             log.log_debug(f"Service {svc.id} blocked by circuit breaker")
             return False
 
         # Backoff
-        if self._state.is_in_backoff(svc.id):
+        if self._state.is_in_backoff(svc.id, now):
             return False
 
         # Conditions
-        if not self._conditions_met(svc):
+        if svc.has_condition and not self._conditions_met(svc):
             return False
 
         # Concurrency check
-        if self._state.is_running(svc.id):
-            max_instances = svc.concurrency.get("max_instances", 1)
-            if_running = svc.concurrency.get("if_running", "skip")
-            if max_instances <= 1 and if_running == "skip":
-                self._state.mark_skipped(svc.id)
-                return False
-
-        # Schedule type
-        if svc.schedule_type == "interval":
-            return self._interval_is_due(svc, now)
-
-        if svc.schedule_type == "event":
-            return False  # events are triggered externally
-
-        return False
-
-    def _interval_is_due(self, svc: ServiceConfig, now: float) -> bool:
-        """Check if an interval-scheduled service is due."""
-        interval = svc.interval
-        if interval <= 0:
+        if svc.skip_if_running and self._state.is_running(svc.id):
+            self._state.mark_skipped(svc.id)
             return False
 
-        entry = self._state.get(svc.id)
-        elapsed = now - entry.last_run
-
-        effective_interval = interval
-        if svc.jitter > 0:
-            effective_interval += random.randint(0, svc.jitter)
-
-        return elapsed >= effective_interval
+        return True
 
     def _run_single_service(self, svc: ServiceConfig) -> None:
         """Execute one periodic service."""
@@ -245,13 +289,14 @@ class ServiceScheduler:
     def _poll_background_procs(self) -> None:
         """Check background processes for completion."""
         completed: list[tuple[str, int]] = []
+        now = time.time()
         for svc_id, (proc, svc) in self._background_procs.items():
             rc = proc.poll()
             if rc is not None:
                 # Process completed
                 completed.append((svc_id, rc))
                 if rc == 0:
-                    self._state.mark_completed(svc.id)
+                    self._state.mark_completed(svc.id, now=now)
                     self._cb.record_success(svc)
                     log.log_debug(f"Background service {svc.id} completed (rc=0)")
                 else:
@@ -285,30 +330,14 @@ class ServiceScheduler:
     def trigger_event(self, event: str) -> None:
         """Trigger event-based services that match the event.
 
-        Iterates all enabled event-type services, checks trigger patterns,
-        conditions, and circuit breakers, then runs matching services.
+        Looks up matching event-type services in the registry's trigger
+        index, checks conditions and circuit breakers, then runs them.
 
         Mirrors bash service_trigger_event in lib/service/service-scheduler.sh.
         """
-        for svc in self._registry.get_periodic_services():
-            if svc.schedule_type != "event":
-                continue
-
-            triggers = svc.schedule.get("trigger", [])
-            if isinstance(triggers, str):
-                triggers = [triggers]
-
-            matched = False
-            for pattern in triggers:
-                if self._trigger_matches_event(pattern, event):
-                    matched = True
-                    break
-
-            if not matched:
-                continue
-
+        for svc in self._registry.services_for_event(event):
             # Check conditions before running
-            if not self._conditions_met(svc):
+            if svc.has_condition and not self._conditions_met(svc):
                 log.log_debug(
                     f"Event '{event}' for service {svc.id} skipped (conditions)",
                 )
@@ -340,13 +369,14 @@ class ServiceScheduler:
             )
             return
 
+        completed, succeeded, failed = self._registry.completion_events(service_id)
         self._event_depth += 1
         try:
-            self.trigger_event(f"service.completed:{service_id}")
+            self.trigger_event(completed)
             if exit_code == 0:
-                self.trigger_event(f"service.succeeded:{service_id}")
+                self.trigger_event(succeeded)
             else:
-                self.trigger_event(f"service.failed:{service_id}")
+                self.trigger_event(failed)
         finally:
             self._event_depth -= 1
 
@@ -363,24 +393,41 @@ class ServiceScheduler:
             except ProcessLookupError:
                 pass
 
+    @staticmethod
+    def _collect_env_keys(registry: ServiceRegistry) -> frozenset[str]:
+        """Collect env var names read by any enabled service condition."""
+        keys: set[str] = set()
+        for svc in registry.get_enabled():
+            if not svc.has_condition:
+                continue
+            keys.update(svc.condition.get("env_not_equals") or ())
+            if svc.condition.get("file_exists"):
+                keys.add("RALPH_DIR")
+        return frozenset(keys)
+
     def _conditions_met(self, svc: ServiceConfig) -> bool:
-        """Check service conditions (env vars, file existence)."""
+        """Check service conditions (env vars, file existence).
+
+        Hot paths skip this call for services without conditions by
+        testing svc.has_condition first. Env vars are read from the
+        snapshot taken at the start of the current run_phase() call.
+        """
         if svc.condition is None:
             return True
 
+        env = self._env_snapshot
+
         # env_not_equals: { "VAR": "value" } -> skip if VAR == value
         env_ne = svc.condition.get("env_not_equals")
         if env_ne:
-            import os
             for var, val in env_ne.items():
-                if os.environ.get(var) == val:
+                if env.get(var) == val:
                     return False
 
         # file_exists: path -> skip if file doesn't exist
         file_exists = svc.condition.get("file_exists")
         if file_exists:
-            import os
-            ralph_dir = os.environ.get("RALPH_DIR", "")
+            ralph_dir = env.get("RALPH_DIR") or ""
             path = os.path.join(ralph_dir, file_exists) if not os.path.isabs(file_exists) else file_exists
             if not os.path.exists(path):
                 return False
@@ -2,18 +2,43 @@
 
 Same JSON schema as bash service-state.sh for bidirectional compatibility:
 a user can stop the Python orchestrator and restart with bash (or vice versa).
+
+Per-tick flushes append the changed entries to state.wal instead of
+rewriting the whole file; state.json itself is rewritten (and the log
+truncated) every _COMPACT_INTERVAL seconds, once the log holds
+_COMPACT_RECORDS lines, and on shutdown.
+restore() replays any surviving log lines over state.json.
+
+The log only extends the state.json it was started against: each
+Python-written state.json carries a "generation" token and the log's
+first line repeats it. bash never writes the token, so a log left by a
+crashed Python run is ignored once bash has rewritten state.json (bash
+restore folds a matching log in and removes it).
 """
 
 from __future__ import annotations
 
-import json
 import os
 import tempfile
 import time
 from dataclasses import dataclass, field
 
+from wiggum_orchestrator import json_codec
+from wiggum_orchestrator.pid_probe import close_pidfd, open_pidfd, pidfd_exited
+
+# Minimum seconds between full state.json rewrites (see flush)
+_COMPACT_INTERVAL = 10.0
+# Log length that forces an early rewrite, bounding restore() replay work
+_COMPACT_RECORDS = 256
+# Default minimum seconds between save_if_dirty() writes
+_FLUSH_INTERVAL = 1.0
+# Seconds a positive signal-0 liveness check is trusted (no-pidfd fallback)
+_ALIVE_TTL = 0.5
+# Name prefix of in-progress state.json writes (swept by restore)
+_TMP_PREFIX = ".state.json."
 
-@dataclass
+
+@dataclass(slots=True)
 class ServiceEntry:
     """In-memory state for one service."""
 
@@ -35,68 +60,126 @@ class ServiceEntry:
     # Metrics
     total_duration_ms: int = 0
     last_duration_ms: int = 0
-    min_duration_ms: int = 0
+    min_duration_ms: int | None = None  # None until the first run (0 on disk)
     max_duration_ms: int = 0
 
     # Queue (stored as list of dicts)
     queue: list[dict] = field(default_factory=list)
 
+    # Open pidfd for the running pid (None when unavailable); not persisted
+    pidfd: int | None = field(default=None, repr=False, compare=False)
+    # Monotonic time of the last successful signal-0 probe; not persisted
+    alive_at: float | None = field(default=None, repr=False, compare=False)
+
+    def set_pid(self, pid: int | None) -> None:
+        """Set pid, swapping the cached pidfd to match."""
+        close_pidfd(self.pidfd)
+        self.pid = pid
+        self.alive_at = None
+        self.pidfd = open_pidfd(pid) if pid is not None else None
+
 
 class ServiceState:
     """Manages in-memory service state with JSON persistence.
 
     State file: {ralph_dir}/services/state.json
+    Change log: {ralph_dir}/services/state.wal (one entry record per line)
     """
 
-    def __init__(self, ralph_dir: str) -> None:
+    def __init__(
+        self, ralph_dir: str, flush_interval: float = _FLUSH_INTERVAL,
+    ) -> None:
         self._ralph_dir = ralph_dir
         self._state_dir = os.path.join(ralph_dir, "services")
         self._state_file = os.path.join(self._state_dir, "state.json")
+        self._wal_file = os.path.join(self._state_dir, "state.wal")
+        self._wal_fp = None
+        self._wal_records = 0
         self._entries: dict[str, ServiceEntry] = {}
+        self._slots: list[ServiceEntry] = []
         self._dirty = False
+        # Services changed since the last flush; _full marks changes that
+        # were not attributed to a service and need a full rewrite
+        self._pending: set[str] = set()
+        self._full = False
+        self._compacted_at: float | None = None
+        self._flush_interval = flush_interval
+        self._flushed_at: float | None = None
+        # Encoded "services" object last written to state.json
+        self._written: bytes | None = None
+        # Generation token of the state.json the log extends
+        self._generation: str | None = None
 
     def get(self, service_id: str) -> ServiceEntry:
         """Get or create state entry for a service."""
-        if service_id not in self._entries:
-            self._entries[service_id] = ServiceEntry()
-        return self._entries[service_id]
+        try:
+            return self._entries[service_id]
+        except KeyError:
+            entry = self._entries[service_id] = ServiceEntry()
+            return entry
+
+    def bind(self, service_ids: list[str]) -> None:
+        """Preallocate entries so they can be addressed by position.
+
+        Args:
+            service_ids: IDs ordered by ServiceConfig.state_index.
+        """
+        self._slots = [self.get(sid) for sid in service_ids]
+
+    def at(self, index: int) -> ServiceEntry:
+        """Get the entry bound at a position (see bind()).
+
+        Returns the same object as get() for that service, so mutations
+        through either accessor are shared.
+        """
+        return self._slots[index]
 
     def mark_dirty(self) -> None:
+        self._full = True
+        self._dirty = True
+
+    def _touch(self, service_id: str) -> None:
+        self._pending.add(service_id)
         self._dirty = True
 
     # ------------------------------------------------------------------
     # Lifecycle marks
+    #
+    # Methods that read the clock take an optional ``now`` so a caller
+    # handling a batch of services can sample time.time() once.
     # ------------------------------------------------------------------
 
-    def mark_started(self, service_id: str, pid: int | None = None) -> None:
+    def mark_started(
+        self, service_id: str, pid: int | None = None, now: float | None = None,
+    ) -> None:
         entry = self.get(service_id)
         entry.status = "running"
-        entry.last_run = time.time()
+        entry.last_run = time.time() if now is None else now
         entry.run_count += 1
-        entry.pid = pid
-        self._dirty = True
+        entry.set_pid(pid)
+        self._touch(service_id)
 
-    def mark_completed(self, service_id: str) -> None:
+    def mark_completed(self, service_id: str, now: float | None = None) -> None:
         entry = self.get(service_id)
         entry.status = "stopped"
         entry.fail_count = 0
         entry.retry_count = 0
         entry.backoff_until = 0.0
-        entry.last_success = time.time()
+        entry.last_success = time.time() if now is None else now
         entry.success_count += 1
-        entry.pid = None
+        entry.set_pid(None)
         # Reset circuit breaker on success
         if entry.circuit_state != "closed":
             entry.circuit_state = "closed"
             entry.half_open_attempts = 0
-        self._dirty = True
+        self._touch(service_id)
 
     def mark_failed(self, service_id: str) -> None:
         entry = self.get(service_id)
         entry.status = "failed"
         entry.fail_count += 1
-        entry.pid = None
-        self._dirty = True
+        entry.set_pid(None)
+        self._touch(service_id)
 
     def mark_skipped(self, service_id: str) -> None:
         entry = self.get(service_id)
@@ -106,14 +189,24 @@ class ServiceState:
         entry = self.get(service_id)
         if entry.status != "running" or entry.pid is None:
             return False
-        # Verify PID is alive
-        try:
-            os.kill(entry.pid, 0)
-            return True
-        except (ProcessLookupError, PermissionError):
+        # Verify PID is alive: pidfd when available, else signal 0. The
+        # pidfd poll is exact; signal-0 hits are reused for _ALIVE_TTL.
+        if entry.pidfd is not None:
+            alive = not pidfd_exited(entry.pidfd)
+        else:
+            now = time.monotonic()
+            if entry.alive_at is not None and now - entry.alive_at < _ALIVE_TTL:
+                return True
+            try:
+                os.kill(entry.pid, 0)
+                alive = True
+                entry.alive_at = now
+            except (ProcessLookupError, PermissionError):
+                alive = False
+        if not alive:
             entry.status = "stopped"
-            entry.pid = None
-            return False
+            entry.set_pid(None)
+        return alive
 
     def record_execution(
         self, service_id: str, duration_ms: int, exit_code: int,
@@ -121,89 +214,202 @@ class ServiceState:
         entry = self.get(service_id)
         entry.last_duration_ms = duration_ms
         entry.total_duration_ms += duration_ms
-        if entry.min_duration_ms == 0 or duration_ms < entry.min_duration_ms:
-            entry.min_duration_ms = duration_ms
-        if duration_ms > entry.max_duration_ms:
-            entry.max_duration_ms = duration_ms
-        self._dirty = True
+        entry.min_duration_ms = (
+            duration_ms if entry.min_duration_ms is None
+            else min(entry.min_duration_ms, duration_ms)
+        )
+        entry.max_duration_ms = max(entry.max_duration_ms, duration_ms)
+        self._touch(service_id)
 
     # ------------------------------------------------------------------
     # Backoff
     # ------------------------------------------------------------------
 
-    def is_in_backoff(self, service_id: str) -> bool:
-        return time.time() < self.get(service_id).backoff_until
+    def is_in_backoff(self, service_id: str, now: float | None = None) -> bool:
+        if now is None:
+            now = time.time()
+        return now < self.get(service_id).backoff_until
 
-    def set_backoff(self, service_id: str, duration: float) -> None:
-        self.get(service_id).backoff_until = time.time() + duration
-        self._dirty = True
+    def set_backoff(
+        self, service_id: str, duration: float, now: float | None = None,
+    ) -> None:
+        if now is None:
+            now = time.time()
+        self.get(service_id).backoff_until = now + duration
+        self._touch(service_id)
 
     # ------------------------------------------------------------------
     # Persistence
     # ------------------------------------------------------------------
 
+    @staticmethod
+    def _entry_record(e: ServiceEntry) -> dict:
+        """Serialize one entry using the bash state.json per-service schema."""
+        return {
+            "last_run": int(e.last_run),
+            "status": e.status,
+            "run_count": e.run_count,
+            "fail_count": e.fail_count,
+            "pid": e.pid,
+            "circuit": {
+                "state": e.circuit_state,
+                "opened_at": int(e.circuit_opened_at),
+                "half_open_attempts": e.half_open_attempts,
+            },
+            "metrics": {
+                "total_duration_ms": e.total_duration_ms,
+                "success_count": e.success_count,
+                "last_duration_ms": e.last_duration_ms,
+                "min_duration_ms": e.min_duration_ms or 0,
+                "max_duration_ms": e.max_duration_ms,
+            },
+            "queue": e.queue,
+            "backoff_until": int(e.backoff_until),
+            "retry_count": e.retry_count,
+            "last_success": int(e.last_success),
+        }
+
     def save(self) -> None:
-        """Write state.json atomically. Same schema as bash."""
+        """Write state.json atomically and truncate the change log.
+
+        The rewrite is skipped when the services are byte-identical to
+        the last write (saved_at then keeps the time of that write).
+        """
         os.makedirs(self._state_dir, exist_ok=True)
-        now = int(time.time())
-        services = {}
-        for sid, e in self._entries.items():
-            services[sid] = {
-                "last_run": int(e.last_run),
-                "status": e.status,
-                "run_count": e.run_count,
-                "fail_count": e.fail_count,
-                "pid": e.pid,
-                "circuit": {
-                    "state": e.circuit_state,
-                    "opened_at": int(e.circuit_opened_at),
-                    "half_open_attempts": e.half_open_attempts,
-                },
-                "metrics": {
-                    "total_duration_ms": e.total_duration_ms,
-                    "success_count": e.success_count,
-                    "last_duration_ms": e.last_duration_ms,
-                    "min_duration_ms": e.min_duration_ms,
-                    "max_duration_ms": e.max_duration_ms,
-                },
-                "queue": e.queue,
-                "backoff_until": int(e.backoff_until),
-                "retry_count": e.retry_count,
-                "last_success": int(e.last_success),
-            }
-        state = {"version": "1.0", "saved_at": now, "services": services}
-        fd, tmp = tempfile.mkstemp(dir=self._state_dir)
-        try:
-            with os.fdopen(fd, "w") as f:
-                json.dump(state, f)
-            os.rename(tmp, self._state_file)
-        except BaseException:
+        # A dict literal over slot attributes measured faster than an
+        # attrgetter tuple; orjson's dataclass mode can't emit the nested
+        # bash schema, so records stay hand-built.
+        record = self._entry_record
+        services = json_codec.dumps({
+            sid: record(e) for sid, e in self._entries.items()
+        })
+        if services != self._written:
+            generation = "%x" % time.time_ns()
+            # Same bytes json_codec.dumps would produce for the whole state
+            data = (
+                b'{"version":"1.0","saved_at":%d,"generation":"%s","services":%b}'
+                % (int(time.time()), generation.encode(), services)
+            )
+            fd, tmp = tempfile.mkstemp(
+                prefix=_TMP_PREFIX, suffix=".tmp", dir=self._state_dir,
+            )
             try:
-                os.unlink(tmp)
-            except OSError:
-                pass
-            raise
+                with os.fdopen(fd, "wb") as f:
+                    f.write(data)
+                os.replace(tmp, self._state_file)
+            except BaseException:
+                try:
+                    os.unlink(tmp)
+                except OSError:
+                    pass
+                raise
+            self._written = services
+            self._generation = generation
+        # Records are whole-entry snapshots, so a crash before the unlink
+        # just replays values state.json already holds (the generation
+        # check in _replay_wal covers state.json rewritten by bash).
+        self._close_wal()
+        try:
+            os.unlink(self._wal_file)
+        except FileNotFoundError:
+            pass
+        self._wal_records = 0
+        self._pending.clear()
+        self._full = False
         self._dirty = False
+        self._compacted_at = self._flushed_at = time.monotonic()
 
     def save_if_dirty(self) -> None:
-        if self._dirty:
+        """Flush pending changes, at most once per flush_interval.
+
+        Changes made in between are coalesced into the next flush.
+        """
+        if not self._dirty:
+            return
+        if (
+            self._flushed_at is not None
+            and time.monotonic() - self._flushed_at < self._flush_interval
+        ):
+            return
+        self.flush()
+
+    def flush(self) -> None:
+        """Write pending changes now, ignoring the flush interval.
+
+        Appends one record per changed service to state.wal, falling back
+        to a full save() when due for compaction or after mark_dirty().
+        """
+        if not self._dirty:
+            return
+        if (
+            self._full
+            or self._compacted_at is None
+            or time.monotonic() - self._compacted_at >= _COMPACT_INTERVAL
+            or self._wal_records + len(self._pending) > _COMPACT_RECORDS
+        ):
             self.save()
+            return
+        if self._wal_fp is None:
+            os.makedirs(self._state_dir, exist_ok=True)
+            self._wal_fp = open(self._wal_file, "ab")
+            if self._wal_fp.tell() == 0:
+                self._wal_fp.write(
+                    json_codec.dumps({"generation": self._generation}) + b"\n"
+                )
+        self._wal_fp.write(b"".join(
+            json_codec.dumps({"id": sid, "service": self._entry_record(self.get(sid))})
+            + b"\n"
+            for sid in self._pending
+        ))
+        self._wal_fp.flush()
+        self._wal_records += len(self._pending)
+        self._pending.clear()
+        self._dirty = False
+        self._flushed_at = time.monotonic()
+
+    def _close_wal(self) -> None:
+        if self._wal_fp is not None:
+            self._wal_fp.close()
+            self._wal_fp = None
 
     def restore(self) -> bool:
-        """Load state.json, verify PIDs with os.kill(pid, 0).
+        """Load state.json plus state.wal, verify PIDs with os.kill(pid, 0).
 
         Returns:
-            True if state was restored, False if no state file.
+            True if state was restored, False if neither file was readable.
         """
-        if not os.path.isfile(self._state_file):
-            return False
+        # A crash between mkstemp and os.replace leaves a temp file behind
         try:
-            with open(self._state_file) as f:
-                data = json.load(f)
-        except (json.JSONDecodeError, OSError):
+            names = os.listdir(self._state_dir)
+        except OSError:
+            names = []
+        for name in names:
+            if name.startswith(_TMP_PREFIX) and name.endswith(".tmp"):
+                try:
+                    os.unlink(os.path.join(self._state_dir, name))
+                except OSError:
+                    pass
+
+        records: dict[str, dict] = {}
+        found = False
+        generation = None
+        if os.path.isfile(self._state_file):
+            try:
+                with open(self._state_file, "rb") as f:
+                    data = json_codec.loads(f.read())
+                records.update(data.get("services", {}))
+                generation = data.get("generation")
+                found = True
+            except (ValueError, OSError):
+                pass
+        replayed = self._replay_wal(records, generation)
+        if not (found or replayed):
             return False
+        if replayed:
+            # Fold the replayed log into state.json on the next flush
+            self.mark_dirty()
 
-        for sid, raw in data.get("services", {}).items():
+        for sid, raw in records.items():
             e = self.get(sid)
             e.last_run = raw.get("last_run", 0)
             e.run_count = raw.get("run_count", 0)
@@ -214,7 +420,8 @@ class ServiceState:
             e.success_count = raw.get("metrics", {}).get("success_count", 0)
             e.total_duration_ms = raw.get("metrics", {}).get("total_duration_ms", 0)
             e.last_duration_ms = raw.get("metrics", {}).get("last_duration_ms", 0)
-            e.min_duration_ms = raw.get("metrics", {}).get("min_duration_ms", 0)
+            # bash writes 0 for "no runs yet"
+            e.min_duration_ms = raw.get("metrics", {}).get("min_duration_ms") or None
             e.max_duration_ms = raw.get("metrics", {}).get("max_duration_ms", 0)
             e.queue = raw.get("queue", [])
 
@@ -230,12 +437,49 @@ class ServiceState:
                 try:
                     os.kill(saved_pid, 0)
                     e.status = "running"
-                    e.pid = saved_pid
+                    e.set_pid(saved_pid)
                 except (ProcessLookupError, PermissionError):
                     e.status = "stopped"
-                    e.pid = None
+                    e.set_pid(None)
             else:
                 e.status = "stopped"
-                e.pid = None
+                e.set_pid(None)
 
         return True
+
+    def _replay_wal(self, records: dict[str, dict], generation: str | None) -> bool:
+        """Apply state.wal records over records (later lines win).
+
+        The log is only applied when its header names the generation of
+        the state.json just read; otherwise it extends a state.json that
+        has since been rewritten (e.g. by bash) and is discarded. A torn
+        final line from a crash mid-write is skipped.
+
+        Returns:
+            True if any record was applied.
+        """
+        try:
+            with open(self._wal_file, "rb") as f:
+                lines = f.readlines()
+        except OSError:
+            return False
+        try:
+            header = json_codec.loads(lines[0]) if lines else {}
+            stale = generation is None or header.get("generation") != generation
+        except (ValueError, AttributeError):
+            stale = True
+        if stale:
+            try:
+                os.unlink(self._wal_file)
+            except OSError:
+                pass
+            return False
+        applied = False
+        for line in lines[1:]:
+            try:
+                rec = json_codec.loads(line)
+                records[rec["id"]] = rec["service"]
+            except (ValueError, KeyError, TypeError):
+                continue
+            applied = True
+        return applied
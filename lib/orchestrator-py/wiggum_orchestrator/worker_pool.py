@@ -1,17 +1,39 @@
 """Worker pool — zero-fork PID tracking.
 
-Tracks spawned worker PIDs, detects completion via os.kill(pid, 0),
-and persists pool state to pool.json for cross-process compatibility.
+Tracks spawned worker PIDs, detects completion via a pidfd per worker
+(falling back to os.kill(pid, 0)), and persists pool state to pool.json
+for cross-process compatibility. Workers that are direct children of this
+process are reaped with waitpid so they do not linger as zombies.
 """
 
 from __future__ import annotations
 
-import json
 import os
 import tempfile
 import time
 from dataclasses import dataclass, field
 
+from wiggum_orchestrator import json_codec
+from wiggum_orchestrator.pid_probe import (
+    close_pidfd,
+    exited_pidfds,
+    open_pidfd,
+    pid_alive,
+    live_pids,
+    pidfd_exited,
+)
+
+
+def _is_child(pid: int) -> bool:
+    """Return True if pid is a child of this process (without reaping it)."""
+    try:
+        os.waitid(os.P_PID, pid, os.WEXITED | os.WNOHANG | os.WNOWAIT)
+    except ChildProcessError:
+        return False
+    except AttributeError:  # no waitid (non-Linux): treat as foreign
+        return False
+    return True
+
 
 @dataclass
 class WorkerEntry:
@@ -21,33 +43,92 @@ class WorkerEntry:
     worker_type: str  # main|fix|resolve
     task_id: str
     started_at: float = field(default_factory=time.time)
+    # Open pidfd for liveness checks (None when unavailable); not persisted
+    pidfd: int | None = field(default=None, repr=False, compare=False)
+    # Exit code, known only for reaped children (see reap_children)
+    exit_code: int | None = field(default=None, repr=False, compare=False)
 
 
 class WorkerPool:
-    """PID-based worker tracking with os.kill liveness checks."""
+    """PID-based worker tracking with pidfd / os.kill liveness checks."""
 
     def __init__(self, ralph_dir: str) -> None:
         self._ralph_dir = ralph_dir
         self._pool_file = os.path.join(ralph_dir, "orchestrator", "pool.json")
         self._workers: dict[int, WorkerEntry] = {}
+        # worker_type -> {pid: entry}, kept in step with _workers
+        self._by_type: dict[str, dict[int, WorkerEntry]] = {}
+        # PIDs that are our own children, reaped via waitpid
+        self._owned: set[int] = set()
+
+    def _insert(self, entry: WorkerEntry) -> None:
+        self.remove(entry.pid)
+        self._workers[entry.pid] = entry
+        self._by_type.setdefault(entry.worker_type, {})[entry.pid] = entry
 
     def add(self, pid: int, worker_type: str, task_id: str) -> None:
-        self._workers[pid] = WorkerEntry(
+        """Track a worker.
+
+        Direct children are reaped by this pool, so don't also wait on
+        them through a subprocess.Popen handle.
+        """
+        self._insert(WorkerEntry(
             pid=pid,
             worker_type=worker_type,
             task_id=task_id,
-        )
+            pidfd=open_pidfd(pid),
+        ))
+        if _is_child(pid):
+            self._owned.add(pid)
+
+    def reap_children(
+        self,
+        on_complete: callable | None = None,
+    ) -> list[WorkerEntry]:
+        """Reap exited workers that are our own children.
+
+        One waitpid(pid, WNOHANG) per owned worker; waitpid(-1) is avoided
+        because it would also reap ServiceExecutor's background processes
+        out from under their Popen handles.
+
+        Args:
+            on_complete: Callback(entry) for each reaped worker.
+
+        Returns:
+            List of reaped WorkerEntry objects, with exit_code set.
+        """
+        completed = []
+        for pid in list(self._owned):
+            try:
+                reaped, status = os.waitpid(pid, os.WNOHANG)
+            except ChildProcessError:
+                reaped, status = pid, None  # already reaped elsewhere
+            if reaped == 0:
+                continue
+            entry = self.remove(pid)
+            if status is not None:
+                entry.exit_code = os.waitstatus_to_exitcode(status)
+            completed.append(entry)
+            if on_complete:
+                on_complete(entry)
+        return completed
 
     def remove(self, pid: int) -> WorkerEntry | None:
-        return self._workers.pop(pid, None)
+        entry = self._workers.pop(pid, None)
+        if entry is not None:
+            del self._by_type[entry.worker_type][pid]
+            self._owned.discard(pid)
+            close_pidfd(entry.pidfd)
+            entry.pidfd = None
+        return entry
 
     def count(self, worker_type: str | None = None) -> int:
         if worker_type is None:
             return len(self._workers)
-        return sum(1 for w in self._workers.values() if w.worker_type == worker_type)
+        return len(self._by_type.get(worker_type, ()))
 
     def get_by_type(self, worker_type: str) -> list[WorkerEntry]:
-        return [w for w in self._workers.values() if w.worker_type == worker_type]
+        return list(self._by_type.get(worker_type, {}).values())
 
     def cleanup_finished(
         self,
@@ -55,7 +136,10 @@ class WorkerPool:
     ) -> list[WorkerEntry]:
         """Check all workers, remove finished ones.
 
-        Uses os.kill(pid, 0) for zero-fork liveness check.
+        Our own children are reaped first (see reap_children). Other
+        workers' pidfds are polled together in one syscall (immune to PID
+        reuse); workers without one are checked against a single /proc
+        snapshot taken for this call, or os.kill(pid, 0) without /proc.
 
         Args:
             on_complete: Callback(entry) for each finished worker.
@@ -63,22 +147,39 @@ class WorkerPool:
         Returns:
             List of completed WorkerEntry objects.
         """
-        completed = []
+        completed = self.reap_children(on_complete)
+        exited = exited_pidfds([
+            w.pidfd for pid, w in self._workers.items()
+            if w.pidfd is not None and pid not in self._owned
+        ])
+        live: set[int] | None = None
+        scanned = False
         for pid in list(self._workers.keys()):
+            if pid in self._owned:
+                continue  # still running, or reap_children would have seen it
             entry = self._workers[pid]
-            try:
-                os.kill(pid, 0)
-            except ProcessLookupError:
+            if entry.pidfd is not None:
+                finished = entry.pidfd in exited
+            else:
+                if not scanned:
+                    live = live_pids()
+                    scanned = True
+                if live is None:
+                    # EPERM: process exists but we can't signal it — still alive
+                    finished = not pid_alive(pid)
+                else:
+                    finished = pid not in live
+            if finished:
+                self.remove(pid)
                 completed.append(entry)
-                del self._workers[pid]
                 if on_complete:
                     on_complete(entry)
-            except PermissionError:
-                # Process exists but we can't signal it — still alive
-                pass
         return completed
 
     def is_alive(self, pid: int) -> bool:
+        entry = self._workers.get(pid)
+        if entry is not None and entry.pidfd is not None:
+            return not pidfd_exited(entry.pidfd)
         try:
             os.kill(pid, 0)
             return True
@@ -101,9 +202,9 @@ class WorkerPool:
         data = {"workers": entries}
         fd, tmp = tempfile.mkstemp(dir=os.path.dirname(self._pool_file))
         try:
-            with os.fdopen(fd, "w") as f:
-                json.dump(data, f)
-            os.rename(tmp, self._pool_file)
+            with os.fdopen(fd, "wb") as f:
+                f.write(json_codec.dumps(data))
+            os.replace(tmp, self._pool_file)
         except BaseException:
             try:
                 os.unlink(tmp)
@@ -112,7 +213,7 @@ class WorkerPool:
             raise
 
     def restore(self) -> int:
-        """Restore pool from pool.json, verifying PIDs.
+        """Restore pool from pool.json, keeping only PIDs still alive.
 
         Returns:
             Number of live workers restored.
@@ -120,23 +221,29 @@ class WorkerPool:
         if not os.path.isfile(self._pool_file):
             return 0
         try:
-            with open(self._pool_file) as f:
-                data = json.load(f)
-        except (json.JSONDecodeError, OSError):
+            with open(self._pool_file, "rb") as f:
+                data = json_codec.loads(f.read())
+        except (ValueError, OSError):
             return 0
 
         count = 0
+        live = live_pids()  # one /proc read for all saved workers
         for pid_str, info in data.get("workers", {}).items():
             pid = int(pid_str)
+            if live is not None and pid not in live:
+                continue
+            # /proc lists every user's processes; EPERM means the PID was
+            # reused by someone else's process, which must not hold a slot
             try:
                 os.kill(pid, 0)
             except (ProcessLookupError, PermissionError):
                 continue
-            self._workers[pid] = WorkerEntry(
+            self._insert(WorkerEntry(
                 pid=pid,
                 worker_type=info.get("type", "main"),
                 task_id=info.get("task_id", ""),
                 started_at=info.get("started_at", time.time()),
-            )
+                pidfd=open_pidfd(pid),
+            ))
             count += 1
         return count
@@ -4,6 +4,11 @@
 #
 # Manages state file: .ralph/services/state.json
 #
+# The Python orchestrator also appends per-tick changes to state.wal next to
+# state.json. Restore folds in a log whose header generation matches
+# state.json and removes any log it finds, so a log left by a crashed Python
+# run never outlives a state.json rewritten here.
+#
 # Provides:
 #   service_state_init(ralph_dir)    - Initialize state tracking
 #   service_state_save()             - Persist current state to disk
@@ -157,6 +162,36 @@ service_state_save() {
     mv "$tmp_file" "$_SERVICE_STATE_FILE"
 }
 
+# Fold a state.wal left by the Python orchestrator into state.json
+#
+# The log's first line names the generation of the state.json it extends;
+# records are only applied when it matches. The log is removed either way.
+_service_state_fold_wal() {
+    local wal_file="${_SERVICE_STATE_FILE%.json}.wal"
+    [ -f "$wal_file" ] || return 0
+
+    local state_gen wal_gen
+    state_gen=$(jq -r '.generation // empty' "$_SERVICE_STATE_FILE" 2>/dev/null)
+    wal_gen=$(head -n 1 "$wal_file" | jq -r '.generation // empty' 2>/dev/null)
+
+    if [ -n "$state_gen" ] && [ "$state_gen" = "$wal_gen" ]; then
+        local tmp_file
+        tmp_file=$(mktemp "${_SERVICE_STATE_FILE}.XXXXXX")
+        # Later lines win; a torn final line is skipped by fromjson?
+        if jq --rawfile wal "$wal_file" '
+            .services += ([$wal | split("\n")[] | fromjson?
+                | select(type == "object" and has("id") and has("service"))
+                | {(.id): .service}] | add // {})
+        ' "$_SERVICE_STATE_FILE" > "$tmp_file" 2>/dev/null; then
+            mv "$tmp_file" "$_SERVICE_STATE_FILE"
+        else
+            rm -f "$tmp_file"
+            log_warn "Could not replay service state log, ignoring it"
+        fi
+    fi
+    rm -f "$wal_file"
+}
+
 # Load state from disk on restart
 #
 # Restores last_run timestamps and run counts. Running statuses are
@@ -173,6 +208,8 @@ service_state_restore() {
         return 1
     fi
 
+    _service_state_fold_wal
+
     # Single jq call: extract all service data as TSV
     # Fields: id, last_run, run_count, fail_count, last_success, circuit.state,
     #         circuit.opened_at, circuit.half_open_attempts, metrics.*,
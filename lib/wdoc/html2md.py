@@ -12,20 +12,47 @@ Extracts main content area when possible (id=content-area, main, article).
 import os
 import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from html.parser import HTMLParser
 from pathlib import Path
 
 # Tags whose content is discarded entirely
 SKIP_TAGS = {"nav", "footer", "aside", "script", "style", "svg", "noscript"}
 
-# IDs/roles that indicate the main content area
-CONTENT_IDS = {"content-area", "content", "main-content", "article-content"}
-CONTENT_TAGS = {"article", "main"}
+# IDs/roles that indicate the main content area, in priority order
+CONTENT_IDS = ("content-area", "content", "main-content", "article-content")
+CONTENT_TAGS = ("article", "main")
 
 # Classes/roles that indicate sidebar/chrome to skip
 SKIP_CLASSES = {"sidebar", "side-bar", "toc", "navigation", "nav-", "navbar",
                 "breadcrumb", "pagination", "footer", "header-nav"}
 
+# Precompiled patterns (extract_content_area runs once per file, the
+# skip-class check once per div/section/span). Candidates are searched
+# one pattern at a time: each is a literal-prefix scan in C, which
+# measured far faster than a single alternation over all of them.
+_CONTENT_ID_RES = [re.compile(rf'id="{re.escape(cid)}"[^>]*>') for cid in CONTENT_IDS]
+_CONTENT_TAG_RES = [re.compile(rf'<{tag}[^>]*>') for tag in CONTENT_TAGS]
+_BODY_OPEN_RE = re.compile(r'<body[^>]*>')
+_BODY_CLOSE_RE = re.compile(r'</body>')
+_TAG_NAME_RE = re.compile(r'<(\w+)')
+_SKIP_CLASS_RE = re.compile("|".join(map(re.escape, SKIP_CLASSES)))
+_HTML_LINK_RE = re.compile(r'\.html?(?=#|$)')
+# Trailing whitespace per line; the lookbehind anchors each match at the
+# start of a run so long runs are not rescanned from every position
+_TRAILING_WS_RE = re.compile(r'(?<![^\S\n])[^\S\n]+$', re.MULTILINE)
+_BLANKS_RE = re.compile(r'\n{3,}')
+
+# Named entities handle_entityref decodes itself
+_ENTITIES = {"amp": "&", "lt": "<", "gt": ">", "quot": '"', "nbsp": " "}
+
+# Shared (read-only) attribute map for tags without attributes
+_NO_ATTRS = {}
+
+# Batches smaller than this convert serially (worker startup costs more)
+_PARALLEL_MIN_FILES = 8
+
 
 def extract_content_area(html):
     """Extract the main content area from HTML, stripping chrome.
@@ -34,20 +61,22 @@ def extract_content_area(html):
     and content tags (article, main). Falls back to full body if none found.
     """
     # Try known content IDs
-    for cid in CONTENT_IDS:
-        pattern = rf'id="{cid}"[^>]*>'
-        match = re.search(pattern, html)
+    for pattern in _CONTENT_ID_RES:
+        match = pattern.search(html)
         if match:
             start = match.end()
-            # Find the matching closing tag by counting depth
-            extracted = _extract_from_position(html, match.start(), start)
+            # Find the matching closing tag by counting depth from the
+            # tag that carries the id
+            tag_start = html.rfind("<", 0, match.start())
+            if tag_start < 0:
+                continue
+            extracted = _extract_from_position(html, tag_start, start)
             if extracted and len(extracted) > 200:
                 return extracted
 
     # Try content tags (article, main)
-    for tag in CONTENT_TAGS:
-        pattern = rf'<{tag}[^>]*>'
-        match = re.search(pattern, html)
+    for pattern in _CONTENT_TAG_RES:
+        match = pattern.search(html)
         if match:
             start = match.end()
             extracted = _extract_from_position(html, match.start(), start)
@@ -55,43 +84,38 @@ def extract_content_area(html):
                 return extracted
 
     # Try body
-    body_match = re.search(r'<body[^>]*>', html)
+    body_match = _BODY_OPEN_RE.search(html)
     if body_match:
-        end_match = re.search(r'</body>', html)
+        end_match = _BODY_CLOSE_RE.search(html)
         if end_match:
             return html[body_match.end():end_match.start()]
 
     return html
 
 
+@lru_cache(maxsize=None)
+def _depth_pattern(tag_name):
+    """Compiled pattern matching open or close tags of tag_name, in order."""
+    return re.compile(rf'<{tag_name}[\s>]|</{tag_name}>')
+
+
 def _extract_from_position(html, tag_start, content_start):
     """Extract content from a position, finding the matching close tag."""
     # Determine the tag name from the opening
-    tag_match = re.match(r'<(\w+)', html[tag_start:])
+    tag_match = _TAG_NAME_RE.match(html, tag_start)
     if not tag_match:
         return None
     tag_name = tag_match.group(1)
 
+    # One left-to-right pass over open/close events
     depth = 1
-    pos = content_start
-    open_pattern = re.compile(rf'<{tag_name}[\s>]')
-    close_pattern = re.compile(rf'</{tag_name}>')
-
-    while depth > 0 and pos < len(html):
-        next_open = open_pattern.search(html, pos)
-        next_close = close_pattern.search(html, pos)
-
-        if next_close is None:
-            break
-
-        if next_open and next_open.start() < next_close.start():
-            depth += 1
-            pos = next_open.end()
-        else:
+    for m in _depth_pattern(tag_name).finditer(html, content_start):
+        if html.startswith("</", m.start()):
             depth -= 1
             if depth == 0:
-                return html[content_start:next_close.start()]
-            pos = next_close.end()
+                return html[content_start:m.start()]
+        else:
+            depth += 1
 
     # Fallback: take a generous chunk
     return html[content_start:content_start + 500000]
@@ -101,6 +125,9 @@ class HTML2Markdown(HTMLParser):
     def __init__(self):
         super().__init__()
         self._result = []
+        # Fragments are joined once in get_markdown. Every caller checks
+        # _skip_depth before pushing, so _push is the bare list append.
+        self._push = self._result.append
         self._skip_depth = 0
         self._pre_depth = 0
         self._list_stack = []  # stack of ("ul"|"ol", counter)
@@ -110,13 +137,15 @@ class HTML2Markdown(HTMLParser):
         self._current_cell = []
         self._last_href = None
 
-    def _push(self, text):
-        if self._skip_depth == 0:
-            self._result.append(text)
+    def updatepos(self, i, j):
+        # Source positions (getpos) are never reported, so skip the
+        # newline counting HTMLParser does for every token
+        return j
 
     def handle_starttag(self, tag, attrs):
         tag = tag.lower()
-        attrs_dict = dict(attrs)
+        # Most tags carry no attributes; don't build a dict for those
+        attrs_dict = dict(attrs) if attrs else _NO_ATTRS
 
         # Capture href for links before any skip logic
         if tag == "a":
@@ -128,7 +157,7 @@ class HTML2Markdown(HTMLParser):
             return
         if tag in ("div", "section", "span"):
             cls = (attrs_dict.get("class", "") + " " + attrs_dict.get("role", "")).lower()
-            if any(k in cls for k in SKIP_CLASSES):
+            if _SKIP_CLASS_RE.search(cls):
                 self._skip_depth += 1
                 return
             # Skip sr-only (screen reader only) elements
@@ -229,7 +258,7 @@ class HTML2Markdown(HTMLParser):
                 href = self._last_href
                 # Rewrite .html/.htm cross-links to .md
                 if not href.startswith(("http://", "https://", "mailto:")):
-                    href = re.sub(r'\.html?(?=#|$)', '.md', href)
+                    href = _HTML_LINK_RE.sub('.md', href)
                 self._push(f"]({href})")
             else:
                 self._push("]")
@@ -268,8 +297,7 @@ class HTML2Markdown(HTMLParser):
             self._push(data.replace("\n", " "))
 
     def handle_entityref(self, name):
-        entities = {"amp": "&", "lt": "<", "gt": ">", "quot": '"', "nbsp": " "}
-        self.handle_data(entities.get(name, f"&{name};"))
+        self.handle_data(_ENTITIES.get(name, f"&{name};"))
 
     def handle_charref(self, name):
         try:
@@ -294,15 +322,9 @@ class HTML2Markdown(HTMLParser):
 
     def get_markdown(self):
         text = "".join(self._result)
-        # Clean up excessive blank lines
-        while "\n\n\n" in text:
-            text = text.replace("\n\n\n", "\n\n")
-        # Remove lines that are only whitespace
-        lines = text.split("\n")
-        lines = [line.rstrip() for line in lines]
-        text = "\n".join(lines)
-        # Collapse runs of empty lines
-        text = re.sub(r'\n{3,}', '\n\n', text)
+        # Strip trailing whitespace, then collapse runs of empty lines
+        text = _TRAILING_WS_RE.sub("", text)
+        text = _BLANKS_RE.sub("\n\n", text)
         return text.strip() + "\n"
 
 
@@ -315,37 +337,50 @@ def convert_file(input_path, output_path):
         print(f"Warning: cannot read {input_path}: {e}", file=sys.stderr)
         return False
 
-    # Extract main content area to avoid nav/sidebar noise
+    # Extract main content area to avoid nav/sidebar noise, then drop the
+    # full document so only the extracted slice is resident while parsing
     content = extract_content_area(html)
+    del html
 
     parser = HTML2Markdown()
     parser.feed(content)
+    del content
     md = parser.get_markdown()
 
     if not md.strip():
         return False
 
     os.makedirs(os.path.dirname(output_path), exist_ok=True)
-    with open(output_path, "w", encoding="utf-8") as f:
-        f.write(md)
+    Path(output_path).write_bytes(md.encode("utf-8"))
     return True
 
 
+def _convert_one(paths):
+    """convert_file over an (input, output) pair, for ProcessPoolExecutor.map."""
+    return convert_file(*paths)
+
+
 def convert_directory(input_dir, output_dir):
-    """Convert all HTML files in input_dir to markdown in output_dir."""
+    """Convert all HTML files in input_dir to markdown in output_dir.
+
+    Files are independent, so larger batches are spread across CPU cores.
+    """
     input_path = Path(input_dir)
     output_path = Path(output_dir)
-    converted = 0
-    skipped = 0
-
+    jobs = []
     for html_file in input_path.rglob("*.htm*"):
         rel = html_file.relative_to(input_path)
         md_file = output_path / rel.with_suffix(".md")
+        jobs.append((str(html_file), str(md_file)))
 
-        if convert_file(str(html_file), str(md_file)):
-            converted += 1
-        else:
-            skipped += 1
+    workers = os.cpu_count() or 1
+    if workers > 1 and len(jobs) >= _PARALLEL_MIN_FILES:
+        with ProcessPoolExecutor(max_workers=workers) as ex:
+            results = list(ex.map(_convert_one, jobs, chunksize=16))
+    else:
+        results = [_convert_one(job) for job in jobs]
+    converted = sum(results)
+    skipped = len(results) - converted
 
     print(f"Converted {converted} files, skipped {skipped}", file=sys.stderr)
     return converted
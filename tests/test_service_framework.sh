@@ -76,6 +76,34 @@ test_service_state_save_restore_roundtrip() {
     assert_equals "2" "$fail_count"
 }
 
+test_service_state_restore_folds_matching_wal() {
+    source "$WIGGUM_HOME/lib/service/service-state.sh"
+
+    service_state_init "$RALPH_DIR"
+    service_state_set_last_run "test-svc" 1000
+    service_state_save
+
+    local state_file="$RALPH_DIR/services/state.json"
+    local wal_file="$RALPH_DIR/services/state.wal"
+    local svc
+    svc=$(jq -c '.services["test-svc"] | .last_run = 2000' "$state_file")
+
+    # Log from a different generation (bash rewrote state.json): ignored
+    printf '{"generation":"old"}\n{"id":"test-svc","service":%s}\n' "$svc" > "$wal_file"
+    _SERVICE_LAST_RUN=()
+    service_state_restore
+    assert_equals "1000" "$(service_state_get_last_run "test-svc")"
+    assert_file_not_exists "$wal_file"
+
+    # Log extending this state.json: folded in
+    jq '.generation = "abc"' "$state_file" > "$state_file.tmp" && mv "$state_file.tmp" "$state_file"
+    printf '{"generation":"abc"}\n{"id":"test-svc","service":%s}\n{"id":"te' "$svc" > "$wal_file"
+    _SERVICE_LAST_RUN=()
+    service_state_restore
+    assert_equals "2000" "$(service_state_get_last_run "test-svc")"
+    assert_file_not_exists "$wal_file"
+}
+
 test_service_state_status_transitions() {
     source "$WIGGUM_HOME/lib/service/service-state.sh"
 
@@ -736,6 +764,7 @@ test_meta_handlers_agent_rotation() {
 
 run_test test_service_state_init
 run_test test_service_state_save_restore_roundtrip
+run_test test_service_state_restore_folds_matching_wal
 run_test test_service_state_status_transitions
 run_test test_service_state_run_counter_increments
 run_test test_service_state_failure_counter
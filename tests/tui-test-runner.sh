@@ -6,6 +6,13 @@
 #   ./tests/tui-test-runner.sh -k kanban    # Run tests matching pattern
 #   ./tests/tui-test-runner.sh -v           # Verbose output
 #   ./tests/tui-test-runner.sh --coverage   # Run with coverage
+#   ./tests/tui-test-runner.sh -n 0         # Run serially (no xdist workers)
+#
+# Tests are spread across CPU cores with pytest-xdist, one file per worker
+# (--dist loadfile), and async tests run on uvloop (see conftest.py). Both
+# come from the locked dev extra. pytest-timeout fails any test that runs
+# past 60s, so a Textual pilot stuck waiting for the app to go idle can't
+# stall the run.
 
 set -euo pipefail
 
@@ -44,11 +51,18 @@ echo ""
 echo -e "${YELLOW}Syncing dependencies...${NC}"
 uv sync --extra dev --quiet
 
+# Keep pytest's tmp_path trees in RAM where available (Linux tmpfs); the
+# parser tests create and read back many small files. An explicit TMPDIR
+# from the caller wins.
+if [ -z "${TMPDIR:-}" ] && [ -d /dev/shm ] && [ -w /dev/shm ]; then
+    export TMPDIR=/dev/shm
+fi
+
 echo -e "${YELLOW}Running pytest...${NC}"
 echo ""
 
-# Run pytest with all arguments passed through
-if uv run pytest tests/ "$@"; then
+# Run pytest with all arguments passed through (later -n/--timeout override)
+if uv run pytest -n auto --dist loadfile --timeout 60 tests/ "$@"; then
     echo ""
     echo -e "${GREEN}TUI tests passed! ✓${NC}"
     exit 0
@@ -1,24 +1,43 @@
 """Pytest configuration and fixtures for TUI tests."""
 
+import asyncio
+
 import pytest
 from pathlib import Path
 
+try:
+    import uvloop
+except ImportError:  # optional; tests/tui-test-runner.sh adds it
+    uvloop = None
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
+def event_loop_policy() -> asyncio.AbstractEventLoopPolicy:
+    """Run pytest-asyncio tests (Textual pilots) on uvloop when available."""
+    if uvloop is not None:
+        return uvloop.EventLoopPolicy()
+    return asyncio.DefaultEventLoopPolicy()
+
+
+@pytest.fixture(scope="session")
 def fixtures_dir() -> Path:
     """Return the fixtures directory path."""
     return Path(__file__).parent / "fixtures"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def ralph_empty(fixtures_dir: Path) -> Path:
     """Return path to empty ralph directory fixture."""
     return fixtures_dir / "ralph-empty"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def ralph_with_workers(fixtures_dir: Path) -> Path:
-    """Return path to ralph directory with workers fixture."""
+    """Return path to ralph directory with workers fixture.
+
+    This is the checked-in tree itself, shared by every test; copy it
+    under tmp_path before writing to it.
+    """
     return fixtures_dir / "ralph-with-workers"
 
 
@@ -30,13 +49,34 @@ def tmp_ralph(tmp_path: Path) -> Path:
     """
     ralph_dir = tmp_path / ".ralph"
     ralph_dir.mkdir()
-    (ralph_dir / "workers").mkdir()
-    (ralph_dir / "logs").mkdir()
-    (ralph_dir / "plans").mkdir()
+    # Plain mkdir per directory: copying a prebuilt template with
+    # shutil.copytree measured about twice as slow
+    for name in ("workers", "logs", "plans"):
+        (ralph_dir / name).mkdir()
     return ralph_dir
 
 
 @pytest.fixture
+def worker_logs(tmp_path: Path):
+    """Create an empty worker directory with a logs/ subdirectory.
+
+    Returns (worker_dir, write_log); write_log(content, name="iteration-0.log")
+    writes str or bytes content into logs/.
+    """
+    worker_dir = tmp_path / "worker-TEST-001-1700000000"
+    logs_dir = worker_dir / "logs"
+    logs_dir.mkdir(parents=True)
+
+    def write_log(content: str | bytes, name: str = "iteration-0.log") -> None:
+        if isinstance(content, bytes):
+            (logs_dir / name).write_bytes(content)
+        else:
+            (logs_dir / name).write_text(content)
+
+    return worker_dir, write_log
+
+
+@pytest.fixture(scope="session")
 def sample_kanban_content() -> str:
     """Return sample kanban.md content for testing."""
     return """# Kanban Board
@@ -73,7 +113,7 @@ def sample_kanban_content() -> str:
 """
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_log_content() -> str:
     """Return sample log file content for testing."""
     return """[2024-01-15 10:00:00] INFO: Starting worker for TASK-001
@@ -85,9 +125,12 @@ def sample_log_content() -> str:
 """
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_metrics_data() -> dict:
-    """Return sample metrics.json data for testing."""
+    """Return sample metrics.json data for testing.
+
+    Session-scoped and shared between tests; do not mutate.
+    """
     return {
         "summary": {
             "total_workers": 5,
@@ -142,9 +185,12 @@ def sample_metrics_data() -> dict:
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_iteration_log_entries() -> list[dict]:
-    """Return sample iteration log NDJSON entries for testing."""
+    """Return sample iteration log NDJSON entries for testing.
+
+    Session-scoped and shared between tests; do not mutate.
+    """
     return [
         {
             "type": "iteration_start",
@@ -1,8 +1,8 @@
 """Tests for the main WiggumApp using Textual's Pilot."""
 
 import pytest
+import pytest_asyncio
 from pathlib import Path
-from unittest.mock import patch
 
 from textual.widgets import TabbedContent, Footer
 
@@ -38,7 +38,8 @@ class TestWiggumHeader:
 class TestWiggumAppStartup:
     """Tests for WiggumApp startup and basic functionality."""
 
-    @pytest.mark.asyncio
+    pytestmark = pytest.mark.asyncio
+
     async def test_app_composes_all_panels(self, ralph_with_workers: Path):
         """Test that app creates all expected panels."""
         app = WiggumApp(ralph_with_workers)
@@ -52,7 +53,6 @@ class TestWiggumAppStartup:
             footer = app.query_one(Footer)
             assert footer is not None
 
-    @pytest.mark.asyncio
     async def test_app_title(self, ralph_with_workers: Path):
         """Test that app has correct title."""
         app = WiggumApp(ralph_with_workers)
@@ -60,7 +60,6 @@ class TestWiggumAppStartup:
         async with app.run_test():
             assert app.title == "Wiggum Monitor"
 
-    @pytest.mark.asyncio
     async def test_initial_tab_is_kanban(self, ralph_with_workers: Path):
         """Test that Kanban tab is active by default."""
         app = WiggumApp(ralph_with_workers)
@@ -70,186 +69,152 @@ class TestWiggumAppStartup:
             assert tabbed.active == "kanban"
 
 
-class TestWiggumAppTabNavigation:
-    """Tests for tab navigation functionality."""
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def nav_pilot(ralph_with_workers: Path):
+    """One running app shared by the tab navigation tests.
 
-    @pytest.mark.asyncio
-    async def test_switch_tab_with_number_keys(self, ralph_with_workers: Path):
-        """Test switching tabs using number keys 1-6."""
-        app = WiggumApp(ralph_with_workers)
+    Those tests only change the active tab, so mounting once per module
+    is enough; each test starts with switch_to_kanban(). Yields
+    (app, pilot, history), where history records every active tab change.
+    """
+    app = WiggumApp(ralph_with_workers)
+    async with app.run_test() as pilot:
+        history: list[str] = []
+        app.watch(
+            app.query_one(TabbedContent),
+            "active",
+            lambda tab: history.append(tab),
+            init=False,
+        )
+        yield app, pilot, history
 
-        async with app.run_test() as pilot:
-            tabbed = app.query_one(TabbedContent)
 
-            # Press 2 to switch to Workers
-            await pilot.press("2")
-            assert tabbed.active == "workers"
+def switch_to_kanban(app: WiggumApp, history: list[str]) -> TabbedContent:
+    """Reset the shared app to the Kanban tab and clear the tab history.
 
-            # Press 3 to switch to Logs
-            await pilot.press("3")
-            assert tabbed.active == "logs"
+    Returns the tab container.
+    """
+    app.action_switch_tab("kanban")
+    history.clear()
+    return app.query_one(TabbedContent)
 
-            # Press 4 to switch to Conversations
-            await pilot.press("4")
-            assert tabbed.active == "conversations"
 
-            # Press 5 to switch to Plans
-            await pilot.press("5")
-            assert tabbed.active == "plans"
+class TestWiggumAppTabNavigation:
+    """Tests for tab navigation functionality.
 
-            # Press 6 to switch to Metrics
-            await pilot.press("6")
-            assert tabbed.active == "metrics"
+    Key sequences are pressed in one batch and checked against the
+    recorded tab history rather than asserted key by key.
+    """
 
-            # Press 1 to go back to Kanban
-            await pilot.press("1")
-            assert tabbed.active == "kanban"
+    pytestmark = pytest.mark.asyncio
 
-    @pytest.mark.asyncio
-    async def test_vim_navigation_h_l(self, ralph_with_workers: Path):
-        """Test vim-style h/l navigation between tabs."""
-        app = WiggumApp(ralph_with_workers)
+    async def test_switch_tab_with_number_keys(self, nav_pilot):
+        """Test switching tabs using number keys 1-6."""
+        app, pilot, history = nav_pilot
+        switch_to_kanban(app, history)
 
-        async with app.run_test() as pilot:
-            tabbed = app.query_one(TabbedContent)
+        await pilot.press("2", "3", "4", "5", "6", "1")
 
-            # Start at kanban (index 0)
-            assert tabbed.active == "kanban"
+        assert history == ["workers", "logs", "conversations", "plans", "metrics", "kanban"]
 
-            # Press l to go next
-            await pilot.press("l")
-            assert tabbed.active == "workers"
+    async def test_vim_navigation_h_l(self, nav_pilot):
+        """Test vim-style h/l navigation between tabs."""
+        app, pilot, history = nav_pilot
+        tabbed = switch_to_kanban(app, history)
 
-            # Press l again
-            await pilot.press("l")
-            assert tabbed.active == "logs"
+        # Start at kanban (index 0)
+        assert tabbed.active == "kanban"
 
-            # Press h to go back
-            await pilot.press("h")
-            assert tabbed.active == "workers"
+        # l, l forward to logs; h, h back to kanban
+        await pilot.press("l", "l", "h", "h")
 
-            # Press h to go back to kanban
-            await pilot.press("h")
-            assert tabbed.active == "kanban"
+        assert history == ["workers", "logs", "workers", "kanban"]
 
-    @pytest.mark.asyncio
-    async def test_vim_navigation_H_L(self, ralph_with_workers: Path):
+    async def test_vim_navigation_H_L(self, nav_pilot):
         """Test vim-style H/L to jump to first/last tab."""
-        app = WiggumApp(ralph_with_workers)
-
-        async with app.run_test() as pilot:
-            tabbed = app.query_one(TabbedContent)
+        app, pilot, history = nav_pilot
+        switch_to_kanban(app, history)
 
-            # Press L to go to last tab
-            await pilot.press("L")
-            assert tabbed.active == "memory"
+        await pilot.press("L", "H")
 
-            # Press H to go to first tab
-            await pilot.press("H")
-            assert tabbed.active == "kanban"
+        assert history == ["memory", "kanban"]
 
-    @pytest.mark.asyncio
-    async def test_action_switch_tab(self, ralph_with_workers: Path):
+    async def test_action_switch_tab(self, nav_pilot):
         """Test action_switch_tab method directly."""
-        app = WiggumApp(ralph_with_workers)
-
-        async with app.run_test():
-            tabbed = app.query_one(TabbedContent)
+        app, _pilot, history = nav_pilot
+        tabbed = switch_to_kanban(app, history)
 
-            app.action_switch_tab("workers")
-            assert tabbed.active == "workers"
+        app.action_switch_tab("workers")
+        assert tabbed.active == "workers"
 
-            app.action_switch_tab("metrics")
-            assert tabbed.active == "metrics"
+        app.action_switch_tab("metrics")
+        assert tabbed.active == "metrics"
 
-    @pytest.mark.asyncio
-    async def test_tab_wraps_around(self, ralph_with_workers: Path):
+    async def test_tab_wraps_around(self, nav_pilot):
         """Test that h/l navigation wraps around at boundaries."""
-        app = WiggumApp(ralph_with_workers)
+        app, pilot, history = nav_pilot
+        switch_to_kanban(app, history)
 
-        async with app.run_test() as pilot:
-            tabbed = app.query_one(TabbedContent)
+        # L to the last tab, l wraps to the first, h wraps back to the last
+        await pilot.press("L", "l", "h")
 
-            # Go to last tab
-            await pilot.press("L")
-            assert tabbed.active == "memory"
+        assert history == ["memory", "kanban", "memory"]
 
-            # Press l should wrap to first
-            await pilot.press("l")
-            assert tabbed.active == "kanban"
 
-            # Press h should wrap to last
-            await pilot.press("h")
-            assert tabbed.active == "memory"
+class TestWiggumAppRefreshAndHelp:
+    """Tests for the refresh and help bindings."""
 
+    pytestmark = pytest.mark.asyncio
 
-class TestWiggumAppRefresh:
-    """Tests for refresh functionality."""
+    async def test_misc_keybindings(self, ralph_with_workers: Path):
+        """Test that r, action_refresh and ? run without raising.
 
-    @pytest.mark.asyncio
-    async def test_refresh_action(self, ralph_with_workers: Path):
-        """Test that pressing r triggers refresh."""
+        These only check that dispatch does not raise, so they share one
+        mounted app. q is left to TestWiggumAppQuit since it exits the app.
+        """
         app = WiggumApp(ralph_with_workers)
 
         async with app.run_test() as pilot:
-            # Press r to refresh - should not raise
+            # Press r to refresh
             await pilot.press("r")
-            assert True
-
-    @pytest.mark.asyncio
-    async def test_action_refresh(self, ralph_with_workers: Path):
-        """Test action_refresh method directly."""
-        app = WiggumApp(ralph_with_workers)
-
-        async with app.run_test():
-            # Should not raise
+            # Call action_refresh directly
             app.action_refresh()
-            assert True
-
-
-class TestWiggumAppHelp:
-    """Tests for help functionality."""
-
-    @pytest.mark.asyncio
-    async def test_help_action(self, ralph_with_workers: Path):
-        """Test that pressing ? shows help notification."""
-        app = WiggumApp(ralph_with_workers)
-
-        async with app.run_test() as pilot:
-            # Press ? to show help
+            # Press ? to show help (notification content isn't easy to test)
             await pilot.press("?")
-            # The notification should be displayed (we can't easily test notification content)
-            assert True
+            assert app.is_running
 
 
 class TestWiggumAppWatcher:
     """Tests for file watcher integration."""
 
-    @pytest.mark.asyncio
-    async def test_watcher_started_on_mount(self, ralph_with_workers: Path):
+    pytestmark = pytest.mark.asyncio
+
+    async def test_watcher_started_on_mount(self, ralph_with_workers: Path, monkeypatch):
         """Test that watcher is started when app mounts."""
         app = WiggumApp(ralph_with_workers)
+        calls = []
+        monkeypatch.setattr(app.watcher, "start", lambda *args, **kwargs: calls.append(args))
 
-        with patch.object(app.watcher, "start") as mock_start:
-            async with app.run_test():
-                mock_start.assert_called_once()
+        async with app.run_test():
+            assert len(calls) == 1
 
-    @pytest.mark.asyncio
-    async def test_watcher_stopped_on_unmount(self, ralph_with_workers: Path):
+    async def test_watcher_stopped_on_unmount(self, ralph_with_workers: Path, monkeypatch):
         """Test that watcher is stopped when app unmounts."""
         app = WiggumApp(ralph_with_workers)
+        calls = []
+        monkeypatch.setattr(app.watcher, "stop", lambda *args, **kwargs: calls.append(args))
 
-        with patch.object(app.watcher, "stop") as mock_stop:
-            async with app.run_test():
-                pass
-            # After context exits, watcher should be stopped
-            mock_stop.assert_called()
+        async with app.run_test():
+            pass
+        # After context exits, watcher should be stopped
+        assert calls
 
 
 class TestWiggumAppQuit:
     """Tests for quit functionality."""
 
-    @pytest.mark.asyncio
+    pytestmark = pytest.mark.asyncio
+
     async def test_quit_binding(self, ralph_with_workers: Path):
         """Test that q key quits the app."""
         app = WiggumApp(ralph_with_workers)
@@ -258,13 +223,13 @@ class TestWiggumAppQuit:
             # Press q to quit
             await pilot.press("q")
             # App should be exiting (run_test handles this gracefully)
-            assert True
 
 
 class TestWiggumAppEmptyRalph:
     """Tests with empty ralph directory."""
 
-    @pytest.mark.asyncio
+    pytestmark = pytest.mark.asyncio
+
     async def test_app_handles_empty_ralph(self, ralph_empty: Path):
         """Test that app handles empty ralph directory gracefully."""
         app = WiggumApp(ralph_empty)
@@ -274,25 +239,19 @@ class TestWiggumAppEmptyRalph:
             tabbed = app.query_one(TabbedContent)
             assert tabbed is not None
 
-            # Switch through all tabs
-            for key in ["1", "2", "3", "4", "5", "6"]:
-                await pilot.press(key)
-
-            # Should complete without errors
-            assert True
+            # Switch through all tabs (one batched press)
+            await pilot.press("1", "2", "3", "4", "5", "6")
 
 
 class TestWiggumAppBindings:
     """Tests for all key bindings."""
 
-    @pytest.mark.asyncio
-    async def test_all_bindings_defined(self, ralph_with_workers: Path):
+    def test_all_bindings_defined(self):
         """Test that all expected bindings are defined."""
-        app = WiggumApp(ralph_with_workers)
-
-        expected_keys = ["q", "1", "2", "3", "4", "5", "6", "r", "?", "h", "l", "H", "L"]
+        expected_keys = {"q", "1", "2", "3", "4", "5", "6", "r", "?", "h", "l", "H", "L"}
 
-        async with app.run_test():
-            binding_keys = [b.key for b in app.BINDINGS]
-            for key in expected_keys:
-                assert key in binding_keys, f"Missing binding for key: {key}"
+        # BINDINGS is a class attribute, so no app needs to be mounted
+        binding_keys = {b.key for b in WiggumApp.BINDINGS}
+        assert expected_keys <= binding_keys, (
+            f"Missing bindings for keys: {sorted(expected_keys - binding_keys)}"
+        )
@@ -5,6 +5,7 @@ import pytest
 from pathlib import Path
 
 from wiggum_tui.data.conversation_parser import (
+    parse_entries,
     parse_iteration_logs,
     parse_multiple_worker_logs,
     get_conversation_summary,
@@ -22,153 +23,133 @@ from wiggum_tui.data.models import (
 )
 
 
-class TestParseIterationLogs:
-    """Tests for parse_iteration_logs function."""
+WORKER_ID = "worker-TEST-001-1700000000"
 
-    def test_no_logs_directory(self, tmp_path: Path):
-        worker_dir = tmp_path / "worker-TEST-001-1700000000"
-        worker_dir.mkdir()
-        # No logs/ subdirectory
 
-        result = parse_iteration_logs(worker_dir)
+def _entries(log: bytes) -> list[dict]:
+    """Decode an iteration log back into its entries."""
+    return [json.loads(line) for line in log.splitlines()]
 
-        assert result.worker_id == "worker-TEST-001-1700000000"
-        assert result.turns == []
-        assert result.results == []
 
-    def test_empty_logs_directory(self, tmp_path: Path):
-        worker_dir = tmp_path / "worker-TEST-001-1700000000"
-        (worker_dir / "logs").mkdir(parents=True)
+def _ndjson(*entries: dict) -> bytes:
+    """Encode entries as an iteration log (one JSON object per line)."""
+    return "".join(json.dumps(e) + "\n" for e in entries).encode()
 
-        result = parse_iteration_logs(worker_dir)
 
-        assert result.turns == []
+# Single-text assistant entry; fill in the text with TEXT_LOG % b"..."
+TEXT_LOG = b'{"type": "assistant", "message": {"content": [{"type": "text", "text": "%b"}]}}\n'
 
-    def test_parses_system_and_user_prompt(self, tmp_path: Path):
-        worker_dir = tmp_path / "worker-TEST-001-1700000000"
-        logs_dir = worker_dir / "logs"
-        logs_dir.mkdir(parents=True)
+# Iteration log contents, built once at import rather than per test.
+# Flat entries are spelled out as literal JSON; nested ones go through _ndjson.
+PROMPTS_LOG = (
+    b'{"type": "iteration_start", "iteration": 0,'
+    b' "system_prompt": "You are helpful.", "user_prompt": "Fix the bug."}\n'
+)
 
-        log_content = json.dumps(
-            {
-                "type": "iteration_start",
-                "iteration": 0,
-                "system_prompt": "You are helpful.",
-                "user_prompt": "Fix the bug.",
-            }
-        )
-        (logs_dir / "iteration-0.log").write_text(log_content + "\n")
+ASSISTANT_TEXT_LOG = (
+    b'{"type": "assistant", "timestamp": "2024-01-15T10:00:00Z",'
+    b' "message": {"content": [{"type": "text", "text": "I will help you."}]}}\n'
+)
 
-        result = parse_iteration_logs(worker_dir)
+TOOL_CALL_LOG = _ndjson(
+    {
+        "type": "assistant",
+        "timestamp": "2024-01-15T10:00:00Z",
+        "message": {
+            "content": [
+                {
+                    "type": "tool_use",
+                    "id": "tool_001",
+                    "name": "Read",
+                    "input": {"file_path": "/path/to/file.py"},
+                }
+            ]
+        },
+    },
+    {
+        "type": "user",
+        "timestamp": "2024-01-15T10:00:01Z",
+        "tool_use_result": {"content": "file content here"},
+        "message": {
+            "content": [
+                {
+                    "type": "tool_result",
+                    "tool_use_id": "tool_001",
+                    "content": "file content here",
+                }
+            ]
+        },
+    },
+)
 
-        assert result.system_prompt == "You are helpful."
-        assert result.user_prompt == "Fix the bug."
+RESULT_LOG = _ndjson(
+    {
+        "type": "result",
+        "iteration": 0,
+        "subtype": "success",
+        "duration_ms": 15000,
+        "duration_api_ms": 12000,
+        "num_turns": 5,
+        "total_cost_usd": 0.25,
+        "is_error": False,
+        "usage": {
+            "input_tokens": 5000,
+            "output_tokens": 1500,
+            "cache_creation_input_tokens": 500,
+            "cache_read_input_tokens": 3000,
+        },
+    }
+)
 
-    def test_parses_assistant_text(self, tmp_path: Path):
-        worker_dir = tmp_path / "worker-TEST-001-1700000000"
-        logs_dir = worker_dir / "logs"
-        logs_dir.mkdir(parents=True)
+SUBAGENT_LOG = TEXT_LOG % b"Main agent" + (
+    # Subagent message
+    b'{"type": "assistant", "parent_tool_use_id": "task_001",'
+    b' "message": {"content": [{"type": "text", "text": "Subagent message"}]}}\n'
+)
 
-        entries = [
-            {
-                "type": "assistant",
-                "timestamp": "2024-01-15T10:00:00Z",
-                "message": {"content": [{"type": "text", "text": "I will help you."}]},
-            }
-        ]
-        log_content = "\n".join(json.dumps(e) for e in entries)
-        (logs_dir / "iteration-0.log").write_text(log_content + "\n")
+HELLO_LOG = TEXT_LOG % b"Hello"
 
-        result = parse_iteration_logs(worker_dir)
+PROMPTS_AND_HELLO_LOG = (
+    b'{"type": "iteration_start", "system_prompt": "System", "user_prompt": "User"}\n'
+    + HELLO_LOG
+)
 
-        assert len(result.turns) == 1
-        assert result.turns[0].assistant_text == "I will help you."
+FIRST_WORKER_LOG = TEXT_LOG % b"First worker"
 
-    def test_parses_tool_calls(self, tmp_path: Path):
-        worker_dir = tmp_path / "worker-TEST-001-1700000000"
-        logs_dir = worker_dir / "logs"
-        logs_dir.mkdir(parents=True)
+SECOND_WORKER_LOG = TEXT_LOG % b"Second worker"
 
-        entries = [
-            {
-                "type": "assistant",
-                "timestamp": "2024-01-15T10:00:00Z",
-                "message": {
-                    "content": [
-                        {
-                            "type": "tool_use",
-                            "id": "tool_001",
-                            "name": "Read",
-                            "input": {"file_path": "/path/to/file.py"},
-                        }
-                    ]
-                },
-            },
-            {
-                "type": "user",
-                "timestamp": "2024-01-15T10:00:01Z",
-                "tool_use_result": {"content": "file content here"},
-                "message": {
-                    "content": [
-                        {
-                            "type": "tool_result",
-                            "tool_use_id": "tool_001",
-                            "content": "file content here",
-                        }
-                    ]
-                },
-            },
-        ]
-        log_content = "\n".join(json.dumps(e) for e in entries)
-        (logs_dir / "iteration-0.log").write_text(log_content + "\n")
+NO_PROMPTS_LOG = TEXT_LOG % b"First"
 
-        result = parse_iteration_logs(worker_dir)
+SECOND_PROMPTS_LOG = (
+    b'{"type": "iteration_start", "system_prompt": "System from second",'
+    b' "user_prompt": "User from second"}\n'
+    + TEXT_LOG % b"Second"
+)
 
-        assert len(result.turns) == 1
-        assert len(result.turns[0].tool_calls) == 1
-        assert result.turns[0].tool_calls[0].name == "Read"
-        assert result.turns[0].tool_calls[0].input == {"file_path": "/path/to/file.py"}
-        assert result.turns[0].tool_calls[0].result == {"content": "file content here"}
 
-    def test_parses_result_entries(self, tmp_path: Path):
+class TestParseIterationLogs:
+    """Tests for parse_iteration_logs function."""
+
+    def test_no_logs_directory(self, tmp_path: Path):
         worker_dir = tmp_path / "worker-TEST-001-1700000000"
-        logs_dir = worker_dir / "logs"
-        logs_dir.mkdir(parents=True)
+        worker_dir.mkdir()
+        # No logs/ subdirectory
 
-        entries = [
-            {
-                "type": "result",
-                "iteration": 0,
-                "subtype": "success",
-                "duration_ms": 15000,
-                "duration_api_ms": 12000,
-                "num_turns": 5,
-                "total_cost_usd": 0.25,
-                "is_error": False,
-                "usage": {
-                    "input_tokens": 5000,
-                    "output_tokens": 1500,
-                    "cache_creation_input_tokens": 500,
-                    "cache_read_input_tokens": 3000,
-                },
-            }
-        ]
-        log_content = "\n".join(json.dumps(e) for e in entries)
-        (logs_dir / "iteration-0.log").write_text(log_content + "\n")
+        result = parse_iteration_logs(worker_dir)
+
+        assert result.worker_id == "worker-TEST-001-1700000000"
+        assert result.turns == []
+        assert result.results == []
+
+    def test_empty_logs_directory(self, worker_logs):
+        worker_dir, _write_log = worker_logs
 
         result = parse_iteration_logs(worker_dir)
 
-        assert len(result.results) == 1
-        assert result.results[0].subtype == "success"
-        assert result.results[0].duration_ms == 15000
-        assert result.results[0].total_cost_usd == 0.25
-        assert result.results[0].usage.input == 5000
-        assert result.results[0].usage.output == 1500
+        assert result.turns == []
 
-    def test_handles_invalid_json(self, tmp_path: Path):
-        worker_dir = tmp_path / "worker-TEST-001-1700000000"
-        logs_dir = worker_dir / "logs"
-        logs_dir.mkdir(parents=True)
+    def test_handles_invalid_json(self, worker_logs):
+        worker_dir, write_log = worker_logs
 
         # Mix valid and invalid JSON
         content = (
@@ -176,7 +157,7 @@ class TestParseIterationLogs:
             "not valid json\n"
             '{"type": "result", "iteration": 0, "subtype": "success"}\n'
         )
-        (logs_dir / "iteration-0.log").write_text(content)
+        write_log(content)
 
         result = parse_iteration_logs(worker_dir)
 
@@ -193,26 +174,53 @@ class TestParseIterationLogs:
         assert len(result.turns) >= 1
         assert len(result.results) >= 1
 
-    def test_skips_subagent_messages(self, tmp_path: Path):
-        worker_dir = tmp_path / "worker-TEST-001-1700000000"
-        logs_dir = worker_dir / "logs"
-        logs_dir.mkdir(parents=True)
 
-        entries = [
-            {
-                "type": "assistant",
-                "message": {"content": [{"type": "text", "text": "Main agent"}]},
-            },
-            {
-                "type": "assistant",
-                "parent_tool_use_id": "task_001",  # Subagent message
-                "message": {"content": [{"type": "text", "text": "Subagent message"}]},
-            },
-        ]
-        log_content = "\n".join(json.dumps(e) for e in entries)
-        (logs_dir / "iteration-0.log").write_text(log_content + "\n")
+class TestParseEntries:
+    """Tests for parse_entries function."""
 
-        result = parse_iteration_logs(worker_dir)
+    def test_parses_system_and_user_prompt(self):
+        entries = _entries(PROMPTS_LOG)
+
+        result = parse_entries(entries, WORKER_ID)
+
+        assert result.system_prompt == "You are helpful."
+        assert result.user_prompt == "Fix the bug."
+
+    def test_parses_assistant_text(self):
+        entries = _entries(ASSISTANT_TEXT_LOG)
+
+        result = parse_entries(entries, WORKER_ID)
+
+        assert len(result.turns) == 1
+        assert result.turns[0].assistant_text == "I will help you."
+
+    def test_parses_tool_calls(self):
+        entries = _entries(TOOL_CALL_LOG)
+
+        result = parse_entries(entries, WORKER_ID)
+
+        assert len(result.turns) == 1
+        assert len(result.turns[0].tool_calls) == 1
+        assert result.turns[0].tool_calls[0].name == "Read"
+        assert result.turns[0].tool_calls[0].input == {"file_path": "/path/to/file.py"}
+        assert result.turns[0].tool_calls[0].result == {"content": "file content here"}
+
+    def test_parses_result_entries(self):
+        entries = _entries(RESULT_LOG)
+
+        result = parse_entries(entries, WORKER_ID)
+
+        assert len(result.results) == 1
+        assert result.results[0].subtype == "success"
+        assert result.results[0].duration_ms == 15000
+        assert result.results[0].total_cost_usd == 0.25
+        assert result.results[0].usage.input == 5000
+        assert result.results[0].usage.output == 1500
+
+    def test_skips_subagent_messages(self):
+        entries = _entries(SUBAGENT_LOG)
+
+        result = parse_entries(entries, WORKER_ID)
 
         # Should only have the main agent turn
         assert len(result.turns) == 1
@@ -388,18 +396,19 @@ class TestGetConversationSummary:
 class TestTruncateText:
     """Tests for truncate_text function."""
 
-    def test_short_text_unchanged(self):
-        result = truncate_text("Hello", max_length=100)
-        assert result == "Hello"
-
-    def test_exact_length_unchanged(self):
-        result = truncate_text("12345", max_length=5)
-        assert result == "12345"
-
-    def test_truncates_long_text(self):
-        result = truncate_text("Hello World!", max_length=10)
-        assert result == "Hello W..."
-        assert len(result) == 10
+    @pytest.mark.parametrize(
+        "text,max_length,expected",
+        [
+            ("Hello", 100, "Hello"),
+            ("12345", 5, "12345"),
+            ("Hello World!", 10, "Hello W..."),
+        ],
+        ids=["short_text_unchanged", "exact_length_unchanged", "truncates_long_text"],
+    )
+    def test_truncate(self, text, max_length, expected):
+        result = truncate_text(text, max_length=max_length)
+        assert result == expected
+        assert len(result) <= max_length
 
     def test_default_max_length(self):
         long_text = "x" * 200
@@ -411,44 +420,39 @@ class TestTruncateText:
 class TestFormatToolResult:
     """Tests for format_tool_result function."""
 
-    def test_none_result(self):
-        result = format_tool_result(None)
-        assert result == "(no result)"
-
-    def test_text_type_with_file(self):
-        result = format_tool_result(
-            {"type": "text", "file": {"filePath": "/path/to/file.py"}}
-        )
-        assert result == "Read: /path/to/file.py"
-
-    def test_tool_result_type(self):
-        result = format_tool_result(
-            {"type": "tool_result", "content": "Some output content"}
-        )
-        assert "Some output content" in result
-
-    def test_stdout_result(self):
-        result = format_tool_result({"stdout": "Command output"})
-        assert "Command output" in result
-
-    def test_error_result(self):
-        result = format_tool_result({"error": "Something went wrong"})
-        assert "Error:" in result
-        assert "Something went wrong" in result
-
-    def test_success_result(self):
-        assert format_tool_result({"success": True}) == "Success"
-        assert format_tool_result({"success": False}) == "Failed"
+    @pytest.mark.parametrize(
+        "value,expected",
+        [
+            (None, "(no result)"),
+            ({"type": "text", "file": {"filePath": "/path/to/file.py"}}, "Read: /path/to/file.py"),
+            ({"success": True}, "Success"),
+            ({"success": False}, "Failed"),
+            ("Simple string result", "Simple string result"),
+        ],
+        ids=["none", "text_type_with_file", "success", "failure", "string"],
+    )
+    def test_exact_result(self, value, expected):
+        assert format_tool_result(value) == expected
+
+    @pytest.mark.parametrize(
+        "value,expected_parts",
+        [
+            ({"type": "tool_result", "content": "Some output content"}, ["Some output content"]),
+            ({"stdout": "Command output"}, ["Command output"]),
+            ({"error": "Something went wrong"}, ["Error:", "Something went wrong"]),
+        ],
+        ids=["tool_result_type", "stdout", "error"],
+    )
+    def test_result_contains(self, value, expected_parts):
+        result = format_tool_result(value)
+        for part in expected_parts:
+            assert part in result
 
     def test_generic_dict(self):
         result = format_tool_result({"a": 1, "b": 2, "c": 3})
         assert "{...}" in result
         assert "a" in result or "b" in result or "c" in result
 
-    def test_string_result(self):
-        result = format_tool_result("Simple string result")
-        assert result == "Simple string result"
-
     def test_truncates_long_content(self):
         long_content = "x" * 500
         result = format_tool_result({"stdout": long_content}, max_length=50)
@@ -470,15 +474,7 @@ class TestParseMultipleWorkerLogs:
         logs_dir = worker_dir / "logs"
         logs_dir.mkdir(parents=True)
 
-        log_content = json.dumps({
-            "type": "iteration_start",
-            "system_prompt": "System",
-            "user_prompt": "User"
-        }) + "\n" + json.dumps({
-            "type": "assistant",
-            "message": {"content": [{"type": "text", "text": "Hello"}]}
-        })
-        (logs_dir / "iteration-0.log").write_text(log_content)
+        (logs_dir / "iteration-0.log").write_bytes(PROMPTS_AND_HELLO_LOG)
 
         result = parse_multiple_worker_logs([(worker_dir, 1700000000)], "TASK-001")
 
@@ -492,19 +488,13 @@ class TestParseMultipleWorkerLogs:
         worker1 = tmp_path / "worker-TASK-001-1700000000"
         logs1 = worker1 / "logs"
         logs1.mkdir(parents=True)
-        (logs1 / "iteration-0.log").write_text(json.dumps({
-            "type": "assistant",
-            "message": {"content": [{"type": "text", "text": "First worker"}]}
-        }))
+        (logs1 / "iteration-0.log").write_bytes(FIRST_WORKER_LOG)
 
         # Create second worker (newer)
         worker2 = tmp_path / "worker-TASK-001-1700000001"
         logs2 = worker2 / "logs"
         logs2.mkdir(parents=True)
-        (logs2 / "iteration-0.log").write_text(json.dumps({
-            "type": "assistant",
-            "message": {"content": [{"type": "text", "text": "Second worker"}]}
-        }))
+        (logs2 / "iteration-0.log").write_bytes(SECOND_WORKER_LOG)
 
         result = parse_multiple_worker_logs([
             (worker1, 1700000000),
@@ -521,10 +511,7 @@ class TestParseMultipleWorkerLogs:
         worker_dir = tmp_path / "worker-TASK-001-1700000000"
         logs_dir = worker_dir / "logs"
         logs_dir.mkdir(parents=True)
-        (logs_dir / "iteration-0.log").write_text(json.dumps({
-            "type": "assistant",
-            "message": {"content": [{"type": "text", "text": "Hello"}]}
-        }))
+        (logs_dir / "iteration-0.log").write_bytes(HELLO_LOG)
 
         result = parse_multiple_worker_logs([(worker_dir, 1700000000)], "TASK-001")
 
@@ -537,25 +524,13 @@ class TestParseMultipleWorkerLogs:
         worker1 = tmp_path / "worker-TASK-001-1700000000"
         logs1 = worker1 / "logs"
         logs1.mkdir(parents=True)
-        (logs1 / "iteration-0.log").write_text(json.dumps({
-            "type": "assistant",
-            "message": {"content": [{"type": "text", "text": "First"}]}
-        }))
+        (logs1 / "iteration-0.log").write_bytes(NO_PROMPTS_LOG)
 
         # Second worker has prompts
         worker2 = tmp_path / "worker-TASK-001-1700000001"
         logs2 = worker2 / "logs"
         logs2.mkdir(parents=True)
-        (logs2 / "iteration-0.log").write_text(
-            json.dumps({
-                "type": "iteration_start",
-                "system_prompt": "System from second",
-                "user_prompt": "User from second"
-            }) + "\n" + json.dumps({
-                "type": "assistant",
-                "message": {"content": [{"type": "text", "text": "Second"}]}
-            })
-        )
+        (logs2 / "iteration-0.log").write_bytes(SECOND_PROMPTS_LOG)
 
         result = parse_multiple_worker_logs([
             (worker1, 1700000000),
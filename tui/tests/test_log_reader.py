@@ -2,6 +2,7 @@
 
 from pathlib import Path
 
+from wiggum_tui.data import log_reader
 from wiggum_tui.data.log_reader import (
     parse_log_line,
     read_log,
@@ -161,6 +162,16 @@ class TestTailLog:
         result = tail_log(log_file, max_lines=100)
         assert len(result) == 1
 
+    def test_reads_back_across_blocks(self, tmp_path: Path, monkeypatch):
+        monkeypatch.setattr(log_reader, "TAIL_BLOCK_SIZE", 16)
+        log_file = tmp_path / "test.log"
+        log_file.write_text(
+            "".join(f"[2024-01-15 10:00:{i:02d}] INFO: Line {i}\r\n" for i in range(50))
+        )
+
+        result = tail_log(log_file, max_lines=3)
+        assert [log.message for log in result] == ["Line 47", "Line 48", "Line 49"]
+
 
 class TestFilterByLevel:
     """Tests for filter_by_level function."""
@@ -232,6 +243,11 @@ class TestSearchLogs:
         result = search_logs(logs, "error")
         assert len(result) == 2
 
+    def test_case_folded_search(self):
+        logs = [LogLine(raw="[time] INFO: Straße closed", message="Straße closed")]
+        result = search_logs(logs, "STRASSE")
+        assert len(result) == 1
+
     def test_searches_raw_content(self):
         logs = [
             LogLine(
@@ -286,6 +302,58 @@ class TestLogTailer:
         assert new_lines[0].message == "Line 2"
         assert new_lines[1].message == "Line 3"
 
+    def test_holds_back_partial_line(self, tmp_path: Path):
+        log_file = tmp_path / "test.log"
+        log_file.write_text("[2024-01-15 10:00:00] INFO: Line 1\n")
+
+        tailer = LogTailer(log_file, max_buffer=100)
+        tailer.get_new_lines()
+
+        # Writer is mid-line: nothing complete to report yet
+        with open(log_file, "a") as f:
+            f.write("[2024-01-15 10:00:01] INFO: Li")
+        assert tailer.get_new_lines() == []
+
+        with open(log_file, "a") as f:
+            f.write("ne 2\n")
+        new_lines = tailer.get_new_lines()
+        assert len(new_lines) == 1
+        assert new_lines[0].message == "Line 2"
+
+    def test_emits_partial_line_once_writer_stops(self, tmp_path: Path):
+        log_file = tmp_path / "test.log"
+        log_file.write_text("[2024-01-15 10:00:00] INFO: Line 1\n")
+
+        tailer = LogTailer(log_file, max_buffer=100)
+        tailer.get_new_lines()
+
+        with open(log_file, "a") as f:
+            f.write("[2024-01-15 10:00:01] INFO: Last words")
+        assert tailer.get_new_lines() == []
+
+        # No new bytes since the last poll: the line is shown as is
+        new_lines = tailer.get_new_lines()
+        assert len(new_lines) == 1
+        assert new_lines[0].message == "Last words"
+        assert tailer.get_new_lines() == []
+
+    def test_initial_read_holds_back_partial_line(self, tmp_path: Path):
+        log_file = tmp_path / "test.log"
+        log_file.write_text(
+            "[2024-01-15 10:00:00] INFO: Line 1\n"
+            "[2024-01-15 10:00:01] INFO: Li"
+        )
+
+        tailer = LogTailer(log_file, max_buffer=100)
+        initial = tailer.get_new_lines()
+        assert [line.message for line in initial] == ["Line 1"]
+
+        with open(log_file, "a") as f:
+            f.write("ne 2\n")
+        new_lines = tailer.get_new_lines()
+        assert len(new_lines) == 1
+        assert new_lines[0].message == "Line 2"
+
     def test_handles_truncation(self, tmp_path: Path):
         log_file = tmp_path / "test.log"
         log_file.write_text(
@@ -1,8 +1,15 @@
 """Conversation parser for iteration log files."""
 
 import json
+from itertools import islice
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable, Iterator
+
+try:
+    from orjson import loads as _loads
+except ImportError:  # orjson is optional; stdlib json also accepts bytes
+    _loads = json.loads
+
 from .models import (
     Conversation,
     ConversationTurn,
@@ -105,8 +112,6 @@ def parse_iteration_logs(worker_dir: Path, use_cache: bool = True) -> Conversati
             if cached_mtime >= current_mtime:
                 return cached_conv
 
-    conversation = Conversation(worker_id=worker_id)
-
     # Sort base logs by mtime, then insert -summary logs directly after their base.
     # A -summary file is only paired if a matching base log exists; otherwise it's
     # treated as a regular log and sorted by its own mtime.
@@ -131,48 +136,83 @@ def parse_iteration_logs(worker_dir: Path, use_cache: bool = True) -> Conversati
         if base.stem in summary_by_base:
             log_files.append(summary_by_base[base.stem])
 
-    all_entries: list[dict[str, Any]] = []
-    results: list[IterationResult] = []
+    conversation = parse_entries(_read_log_entries(log_files), worker_id)
+
+    # Cache the parsed conversation
+    if use_cache:
+        current_mtime = get_logs_max_mtime(logs_dir)
+        _conversation_cache[cache_key] = (current_mtime, conversation)
 
+    return conversation
+
+
+def _read_log_entries(log_files: list[Path]) -> Iterator[dict[str, Any]]:
+    """Stream the JSON entries of iteration log files, in order.
+
+    Each entry is tagged with "_iteration_idx" (its file's position in
+    log_files) and "_log_name" (the file stem). Blank and invalid lines
+    are skipped, as is the rest of a file that cannot be read.
+
+    Args:
+        log_files: Log files in iteration order.
+
+    Yields:
+        Tagged log entries.
+    """
     for idx, log_file in enumerate(log_files):
         log_name = log_file.stem  # e.g., "iteration-0", "validation-review"
         try:
-            content = log_file.read_text()
-            for line in content.split("\n"):
-                if not line.strip():
-                    continue
-                try:
-                    entry = json.loads(line)
-                    entry_type = entry.get("type")
-                    # Tag entry with its iteration index and log name
+            with log_file.open("rb") as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    try:
+                        entry = _loads(line)
+                    except ValueError:
+                        # Invalid JSON (or non-UTF-8 bytes); skip the line
+                        continue
                     entry["_iteration_idx"] = idx
                     entry["_log_name"] = log_name
-
-                    if entry_type == "iteration_start":
-                        if not conversation.system_prompt:
-                            conversation.system_prompt = entry.get("system_prompt", "")
-                            conversation.user_prompt = entry.get("user_prompt", "")
-                    elif entry_type == "result":
-                        result = _parse_result(entry)
-                        result.iteration = idx  # Override with mtime-based index
-                        result.log_name = log_name
-                        results.append(result)
-                    elif entry_type in ("assistant", "user"):
-                        all_entries.append(entry)
-                except json.JSONDecodeError:
-                    continue
+                    yield entry
         except OSError:
             continue
 
-    # Group messages into turns
-    conversation.turns = _group_into_turns(all_entries)
-    conversation.results = results
 
-    # Cache the parsed conversation
-    if use_cache:
-        current_mtime = get_logs_max_mtime(logs_dir)
-        _conversation_cache[cache_key] = (current_mtime, conversation)
+def parse_entries(entries: Iterable[dict[str, Any]], worker_id: str) -> Conversation:
+    """Build a conversation from iteration log entries.
 
+    Entries may carry the "_iteration_idx" and "_log_name" tags added when
+    reading log files; untagged entries count as iteration 0 with no log name.
+
+    Args:
+        entries: Log entries in order.
+        worker_id: Worker ID for the conversation.
+
+    Returns:
+        Conversation object with all turns and results.
+    """
+    conversation = Conversation(worker_id=worker_id)
+    messages: list[dict[str, Any]] = []
+    results: list[IterationResult] = []
+
+    for entry in entries:
+        entry_type = entry.get("type")
+        if entry_type == "iteration_start":
+            if not conversation.system_prompt:
+                conversation.system_prompt = entry.get("system_prompt", "")
+                conversation.user_prompt = entry.get("user_prompt", "")
+        elif entry_type == "result":
+            result = _parse_result(entry)
+            # Override with the mtime-based index
+            result.iteration = entry.get("_iteration_idx", 0)
+            result.log_name = entry.get("_log_name", "")
+            results.append(result)
+        elif entry_type in ("assistant", "user"):
+            messages.append(entry)
+
+    # Group messages into turns
+    conversation.turns = _group_into_turns(messages)
+    conversation.results = results
     return conversation
 
 
@@ -356,7 +396,7 @@ def format_tool_result(result: Any, max_length: int = 200) -> str:
     if isinstance(result, dict):
         # Handle common result types
         if "type" in result:
-            result_type = result.get("type")
+            result_type = result["type"]
             if result_type == "text":
                 # File read result
                 file_info = result.get("file", {})
@@ -375,9 +415,8 @@ def format_tool_result(result: Any, max_length: int = 200) -> str:
         if "success" in result:
             return "Success" if result["success"] else "Failed"
 
-        # Generic dict - show keys
-        keys = list(result.keys())[:5]
-        return f"{{...}} ({', '.join(keys)})"
+        # Generic dict - show the first few keys without copying them all
+        return f"{{...}} ({', '.join(islice(result, 5))})"
 
     return truncate_text(str(result), max_length)
 
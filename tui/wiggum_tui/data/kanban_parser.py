@@ -49,8 +49,8 @@ def parse_kanban(file_path: Path) -> list[Task]:
     current_field: str | None = None
 
     for line in lines:
-        # Check for task line
-        task_match = TASK_PATTERN.match(line)
+        # Check for task line (most lines are fields; skip the regex for them)
+        task_match = TASK_PATTERN.match(line) if line.startswith("- [") else None
 
         if task_match:
             # Save previous task
@@ -125,14 +125,11 @@ def group_tasks_by_status(tasks: list[Task]) -> dict[TaskStatus, list[Task]]:
     Returns:
         Dictionary mapping status to list of tasks.
     """
-    return {
-        TaskStatus.PENDING: [t for t in tasks if t.status == TaskStatus.PENDING],
-        TaskStatus.IN_PROGRESS: [t for t in tasks if t.status == TaskStatus.IN_PROGRESS],
-        TaskStatus.PENDING_APPROVAL: [t for t in tasks if t.status == TaskStatus.PENDING_APPROVAL],
-        TaskStatus.COMPLETE: [t for t in tasks if t.status == TaskStatus.COMPLETE],
-        TaskStatus.NOT_PLANNED: [t for t in tasks if t.status == TaskStatus.NOT_PLANNED],
-        TaskStatus.FAILED: [t for t in tasks if t.status == TaskStatus.FAILED],
-    }
+    # Every status is present (possibly empty); one pass over the tasks
+    grouped: dict[TaskStatus, list[Task]] = {status: [] for status in TaskStatus}
+    for task in tasks:
+        grouped[task.status].append(task)
+    return grouped
 
 
 def get_task_counts(tasks: list[Task]) -> dict[str, int]:
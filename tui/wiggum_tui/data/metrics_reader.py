@@ -1,7 +1,14 @@
 """Metrics reader for metrics.json."""
 
 import json
+from functools import lru_cache
 from pathlib import Path
+
+try:
+    from orjson import loads as _loads
+except ImportError:  # orjson is optional; stdlib json also accepts bytes
+    _loads = json.loads
+
 from .models import Metrics, TokenUsage, CostBreakdown, ContextUsage, WorkerMetrics
 
 
@@ -18,9 +25,9 @@ def read_metrics(file_path: Path) -> Metrics:
         return Metrics()
 
     try:
-        content = file_path.read_text()
-        data = json.loads(content)
-    except (OSError, json.JSONDecodeError):
+        data = _loads(file_path.read_bytes())
+    except (OSError, ValueError):
+        # ValueError covers invalid JSON and non-UTF-8 bytes
         return Metrics()
 
     # Parse summary
@@ -100,6 +107,10 @@ def read_metrics(file_path: Path) -> Metrics:
     )
 
 
+# The format_* helpers are pure, so results are memoized for repeated
+# redraws of the same values. typed=True keeps 5 and 5.0 apart ("5" vs
+# "5.0").
+@lru_cache(maxsize=4096, typed=True)
 def format_tokens(count: int) -> str:
     """Format token count for display.
 
@@ -117,6 +128,7 @@ def format_tokens(count: int) -> str:
         return str(count)
 
 
+@lru_cache(maxsize=4096, typed=True)
 def format_cost(cost: float) -> str:
     """Format cost for display.
 
@@ -129,6 +141,7 @@ def format_cost(cost: float) -> str:
     return f"${cost:.2f}"
 
 
+@lru_cache(maxsize=4096, typed=True)
 def format_duration(seconds: int) -> str:
     """Format duration for display.
 
@@ -150,6 +163,7 @@ def format_duration(seconds: int) -> str:
         return f"{seconds}s"
 
 
+@lru_cache(maxsize=4096, typed=True)
 def format_context(percent: float) -> str:
     """Format context usage percentage for display.
 